@@ -6,19 +6,26 @@ Author: isee15
 Date: 2025-10-28
 """
 import sys
+import codecs
+import functools
+import inspect
 import json
 import os
+import re
+import shlex
 import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, Iterator, List, Tuple, Optional
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QTextEdit, QTreeView, QSplitter,
-    QStatusBar, QMessageBox, QCheckBox, QFormLayout, QTabWidget, QMenu, QComboBox, QSizePolicy, QListWidget, QGroupBox, QStyle, QHeaderView
+    QLabel, QLineEdit, QPushButton, QPlainTextEdit, QTreeView, QSplitter,
+    QStatusBar, QMessageBox, QCheckBox, QFormLayout, QTabWidget, QMenu, QComboBox, QSizePolicy, QListView, QGroupBox, QStyle, QHeaderView
 )
-from PyQt6.QtGui import QStandardItemModel, QStandardItem, QFont, QKeySequence, QAction, QShortcut, QIcon, QPalette, QColor
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QStandardItemModel, QStandardItem, QFont, QTextCursor, QKeySequence, QAction, QShortcut, QIcon, QPalette, QColor
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer, QSettings, QSignalBlocker, QStringListModel, QSortFilterProxyModel, QAbstractListModel, QAbstractItemModel, QModelIndex
 
 # Third-party
 try:
@@ -26,7 +33,29 @@ try:
 except ImportError as e:
     redis = None  # Will surface a clear error in UI when used
 
-# --- Config File Path ---
+# Optional: C-accelerated JSON, falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: OS keyring for connection passwords, falls back to storing them in the settings
+try:
+    import keyring
+except ImportError:
+    keyring = None
+
+# Optional: MessagePack encoding for binary string values
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# --- Settings ---
+# Stored through QSettings (registry / plist / ini, depending on the platform)
+SETTINGS_ORG = "乖猫记账"
+SETTINGS_APP = "RedisViewer"
+# Legacy JSON config, imported once into QSettings when no settings exist yet
 CONFIG_FILE = Path.home() / ".redis_viewer_config.json"
 
 
@@ -47,102 +76,274 @@ class SimpleRedisClientError(Exception):
     pass
 
 
-def _b2s(val: Any) -> Any:
-    """Convert Redis bytes to str recursively."""
-    if isinstance(val, bytes):
+def _is_connection_error(exc: BaseException) -> bool:
+    """True when exc (or the error it was raised from) means the connection itself failed."""
+    # SimpleRedisClientError is raised inside the except block, so the original is its __context__
+    while exc is not None:
+        if redis is not None and isinstance(exc, (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)):
+            return True
+        if isinstance(exc, OSError):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+# SCAN MATCH metacharacters; a pattern without any of them matches exactly one key name
+_GLOB_META = re.compile(r"[*?\[\\]")
+
+# SCAN ... TYPE error replies meaning the server does not know the TYPE option
+_SCAN_TYPE_UNSUPPORTED = re.compile(r"syntax error|unknown", re.IGNORECASE)
+
+# A string value is only parsed as JSON when its first non-blank char opens an object or array
+_JSON_CONTAINER_START = re.compile(r"\s*[\[{]")
+
+
+def _json_loads(text: str) -> Any:
+    if orjson is not None:
         try:
-            return val.decode("utf-8")
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # stdlib accepts a few extras (NaN, big ints) and gives the familiar error message
+    return json.loads(text)
+
+
+def _parse_string_value(val: Any) -> Any:
+    # try parse json, but only when it looks like an object/array, so plain text skips the parse
+    if isinstance(val, str) and _JSON_CONTAINER_START.match(val):
+        try:
+            return _json_loads(val)
         except Exception:
-            return val.decode("utf-8", errors="replace")
-    if isinstance(val, list):
-        return [_b2s(v) for v in val]
-    if isinstance(val, tuple):
-        return tuple(_b2s(v) for v in val)
-    if isinstance(val, dict):
-        return { _b2s(k): _b2s(v) for k, v in val.items() }
+            pass
     return val
 
 
+def _json_dumps(obj: Any) -> Any:
+    """Compact JSON for storing nested values; bytes when orjson is available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits
+    # same bytes as orjson writes: no separator spaces, non-ASCII kept as UTF-8
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _json_pretty(obj: Any) -> str:
+    """Indented JSON text for display and the config file."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits
+    # default=str: bytes (e.g. MessagePack bin fields) are shown by their repr
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+
+
+def _encode_scalar(v: Any) -> Any:
+    # Nested values are stored as JSON text, scalars as their string form.
+    # str/int/float pass straight through: redis-py encodes them to the same text natively.
+    t = type(v)
+    if t is str or t is int or t is float:
+        return v
+    if t is dict or t is list:
+        return _json_dumps(v)
+    return str(v)
+
+
+def _set_string(client, key: str, value_text: str) -> Dict[str, Any]:
+    # allow plain text or JSON
+    # if JSON, we store original string text
+    client.set(key, value_text)
+    return {"acknowledged": True, "operation": "SET", "key": key}
+
+
+def _set_hash(client, key: str, value_text: str) -> Dict[str, Any]:
+    data = _json_loads(value_text)
+    if not isinstance(data, dict):
+        raise ValueError("Hash value must be a JSON object")
+    # HMSET is deprecated; use HSET with mapping
+    client.hset(key, mapping={k: _encode_scalar(v) for k, v in data.items()})
+    return {"acknowledged": True, "operation": "HSET", "key": key, "fields": len(data)}
+
+
+def _set_list(client, key: str, value_text: str) -> Dict[str, Any]:
+    data = _json_loads(value_text)
+    if not isinstance(data, list):
+        raise ValueError("List value must be a JSON array")
+    if data:
+        # replace existing; UNLINK frees the old value off the server main thread
+        # and both commands go out in one round trip
+        with client.pipeline(transaction=False) as pipe:
+            pipe.unlink(key)
+            pipe.rpush(key, *map(_encode_scalar, data))
+            pipe.execute()
+    return {"acknowledged": True, "operation": "RPUSH", "key": key, "length": len(data)}
+
+
+def _set_set(client, key: str, value_text: str) -> Dict[str, Any]:
+    data = _json_loads(value_text)
+    if not isinstance(data, list):
+        raise ValueError("Set value must be a JSON array")
+    if data:
+        with client.pipeline(transaction=False) as pipe:
+            pipe.unlink(key)
+            pipe.sadd(key, *map(_encode_scalar, data))
+            pipe.execute()
+    return {"acknowledged": True, "operation": "SADD", "key": key, "length": len(data)}
+
+
+def _set_zset(client, key: str, value_text: str) -> Dict[str, Any]:
+    data = _json_loads(value_text)
+    # Accept array of {"member":..., "score":...} or [[member, score], ...]
+    if not isinstance(data, list):
+        raise ValueError("ZSet value must be an array of pairs or objects")
+    # single pass straight into the ZADD mapping
+    mapping: Dict[Any, float] = {}
+    for item in data:
+        if isinstance(item, dict):
+            member, score = item.get("member"), item.get("score", 0)
+        else:
+            member, score = item
+        mapping[_encode_scalar(member)] = float(score)
+    if mapping:
+        with client.pipeline(transaction=False) as pipe:
+            pipe.unlink(key)
+            pipe.zadd(key, mapping)
+            pipe.execute()
+    return {"acknowledged": True, "operation": "ZADD", "key": key, "length": len(data)}
+
+
+# value type -> writer used by SimpleRedisClient.set_value
+_SETTERS = {
+    "string": _set_string,
+    "hash": _set_hash,
+    "list": _set_list,
+    "set": _set_set,
+    "zset": _set_zset,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _connection_params(connection_class) -> frozenset:
+    """Keyword arguments accepted by a redis-py connection class.
+
+    Subclasses forward **kwargs to their bases, so the MRO is followed until an
+    __init__ without **kwargs is reached.
+    """
+    names = set()
+    for klass in connection_class.__mro__:
+        init = klass.__dict__.get("__init__")
+        if init is None:
+            continue
+        params = inspect.signature(init).parameters.values()
+        names.update(p.name for p in params if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY))
+        if not any(p.kind is p.VAR_KEYWORD for p in params):
+            break
+    names.discard("self")
+    return frozenset(names)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_ssl_ctx(verify_ssl: bool) -> ssl.SSLContext:
+    # Built once per verify mode and shared by all clients: loading the CA bundle is costly
+    ctx = ssl.create_default_context()
+    if not verify_ssl:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_ctx_ssl_connection(base: type) -> type:
+    """SSLConnection subclass that wraps its sockets with the shared _get_ssl_ctx() context.
+
+    redis-py has no ssl_context option and otherwise builds a fresh context for every connection.
+    Versions without the _wrap_socket_with_ssl hook simply keep their own behavior.
+    """
+    class SharedContextSSLConnection(base):
+        def _wrap_socket_with_ssl(self, sock):
+            verify = self.cert_reqs != ssl.CERT_NONE
+            return _get_ssl_ctx(verify).wrap_socket(sock, server_hostname=self.host)
+
+    return SharedContextSSLConnection
+
+
+# Max keys kept in the per-scan TYPE cache used by the scan type-filter fallback
+_TYPE_CACHE_MAX = 10000
+# TYPE post-filtering fans out over worker threads once a batch has at least two chunks of this size
+_TYPE_FANOUT_CHUNK = 500
+_TYPE_FANOUT_WORKERS = 4
+# String values longer than this (bytes) are streamed into the editor in GETRANGE chunks
+_STREAM_VALUE_MIN = 1 << 20
+_STREAM_CHUNK = 256 * 1024
+
+
 class SimpleRedisClient:
     def __init__(self, host: str, port: int, db: int = 0,
                  username: Optional[str] = None, password: Optional[str] = None,
                  use_ssl: bool = False, verify_ssl: bool = True, timeout: float = 5.0):
         if redis is None:
             raise SimpleRedisClientError("The 'redis' package is not installed. Please install redis>=4.5.")
-        ssl_ctx = None
-        if use_ssl:
-            ssl_ctx = ssl.create_default_context()
-            if not verify_ssl:
-                ssl_ctx.check_hostname = False
-                ssl_ctx.verify_mode = ssl.CERT_NONE
         cert_reqs = ssl.CERT_REQUIRED if verify_ssl else ssl.CERT_NONE
 
-        def _try_pool(kwargs, use_ssl_conn: bool = False):
-            # Attempt to create a ConnectionPool with provided kwargs, removing unsupported args if necessary
-            last_err = None
-            # order of attempts: raw kwargs -> drop username -> drop ssl_context -> drop ssl_cert_reqs
-            attempts = []
-            if use_ssl_conn:
-                # Use legacy SSLConnection class if available
-                SSLConnection = getattr(getattr(redis, 'connection', redis), 'SSLConnection', None)
-                if SSLConnection is None:
-                    raise SimpleRedisClientError("This redis-py version does not support SSLConnection. Please upgrade 'redis' package.")
-                kwargs_conn = dict(kwargs)
-                kwargs_conn['connection_class'] = SSLConnection
-                attempts.append(kwargs_conn)
-                # progressively remove possibly unsupported kwargs
-                for drop in [('username',), ('ssl_context',), ('ssl_cert_reqs',)]:
-                    k = dict(kwargs_conn)
-                    for d in drop:
-                        k.pop(d, None)
-                    attempts.append(k)
-            else:
-                attempts.append(dict(kwargs))
-                # progressively remove
-                for drop in [('username',), ('ssl_context',), ('ssl_cert_reqs',), ('ssl',)]:
-                    k = dict(kwargs)
-                    for d in drop:
-                        k.pop(d, None)
-                    attempts.append(k)
-            for a in attempts:
-                try:
-                    return redis.ConnectionPool(**a)
-                except TypeError as te:
-                    last_err = te
-                    continue
-            raise last_err  # type: ignore[misc]
-
         try:
             base_kwargs = dict(
                 host=host,
                 port=port,
                 db=db,
                 socket_timeout=timeout,
-                decode_responses=False,
+                # Decode in the parser (C-accelerated when hiredis is installed) instead of post-processing
+                decode_responses=True,
+                encoding_errors="replace",
             )
             if password:
                 base_kwargs['password'] = password
             if username:
                 base_kwargs['username'] = username
+            connection_class = getattr(redis, 'connection', redis).Connection
             if use_ssl:
-                base_kwargs['ssl'] = True
+                connection_class = getattr(getattr(redis, 'connection', redis), 'SSLConnection', None)
+                if connection_class is None:
+                    raise SimpleRedisClientError("This redis-py version does not support SSLConnection. Please upgrade 'redis' package.")
+                connection_class = _shared_ctx_ssl_connection(connection_class)
                 base_kwargs['ssl_cert_reqs'] = cert_reqs
-                if ssl_ctx is not None:
-                    base_kwargs['ssl_context'] = ssl_ctx
+                base_kwargs['ssl_check_hostname'] = verify_ssl
 
-            try:
-                # Try modern API first
-                self.pool = _try_pool(base_kwargs, use_ssl_conn=False)
-            except TypeError as te:
-                # Fallback to SSLConnection path if SSL kw not supported
-                if use_ssl and ('ssl' in str(te) or 'ssl_context' in str(te)):
-                    self.pool = _try_pool(base_kwargs, use_ssl_conn=True)
-                else:
-                    raise
+            # Keep only the kwargs this redis-py version's connection class accepts
+            supported = _connection_params(connection_class)
+            self.pool = redis.ConnectionPool(connection_class=connection_class,
+                                             **{k: v for k, v in base_kwargs.items() if k in supported})
             self.client = redis.Redis(connection_pool=self.pool)
+            # Non-decoding client for binary payloads, created on first use
+            self._raw_client = None
+            # None until the first type-filtered SCAN tells us whether the server supports SCAN TYPE
+            self._scan_supports_type: Optional[bool] = None
+            # key -> type, filled by the TYPE post-filter for the pages of one scan (reset whenever a scan
+            # starts at cursor 0, since other clients may change types meanwhile); entries are also
+            # dropped when this client modifies the key
+            self._type_cache: Dict[str, str] = {}
         except Exception as e:
             raise SimpleRedisClientError(f"Failed to initialize Redis client: {e}")
 
+    def close(self):
+        # Close idle pooled sockets; connections still in use by a running task are released by it
+        for client in (self.client, self._raw_client):
+            if client is None:
+                continue
+            try:
+                client.connection_pool.disconnect(inuse_connections=False)
+            except Exception:
+                pass
+
+    @property
+    def raw(self):
+        """Same connection settings as .client, but replies are returned as bytes."""
+        if self._raw_client is None:
+            kwargs = dict(self.pool.connection_kwargs, decode_responses=False)
+            pool = redis.ConnectionPool(connection_class=self.pool.connection_class, **kwargs)
+            self._raw_client = redis.Redis(connection_pool=pool)
+        return self._raw_client
+
     def ping(self) -> bool:
         try:
             return bool(self.client.ping())
@@ -151,7 +352,7 @@ class SimpleRedisClient:
 
     def info(self) -> Dict[str, Any]:
         try:
-            return _b2s(self.client.info())
+            return self.client.info()
         except Exception as e:
             raise SimpleRedisClientError(str(e))
 
@@ -168,195 +369,402 @@ class SimpleRedisClient:
             raise SimpleRedisClientError(str(e))
 
     def expire(self, key: str, seconds: int) -> bool:
+        self._type_cache.pop(key, None)
         try:
             return bool(self.client.expire(key, seconds))
         except Exception as e:
             raise SimpleRedisClientError(str(e))
 
     def delete(self, key: str) -> int:
+        self._type_cache.pop(key, None)
         try:
             return int(self.client.delete(key))
         except Exception as e:
             raise SimpleRedisClientError(str(e))
 
+    def delete_keys(self, keys: List[str]) -> int:
+        """Delete several keys with a single DEL."""
+        for key in keys:
+            self._type_cache.pop(key, None)
+        try:
+            return int(self.client.delete(*keys))
+        except Exception as e:
+            raise SimpleRedisClientError(str(e))
+
     def type(self, key: str) -> str:
         try:
-            return _b2s(self.client.type(key))  # returns bytes or str depending on version
+            return self.client.type(key)
         except Exception as e:
             raise SimpleRedisClientError(str(e))
 
-    def get_value(self, key: str, max_items: int = 200):
+    def get_value(self, key: str, max_items: int = 200, parse_json: bool = True, stream: bool = False):
+        """Read a key as {"type", "key", "value"}, plus "truncated": True when an aggregate was capped.
+
+        String values are parsed as JSON when they look like an object/array and parse_json is set.
+        With stream=True a string longer than _STREAM_VALUE_MIN bytes is not read whole: the result is
+        {"type": "string", "key", "length": <bytes>, "streamed": True, "head": <first bytes, raw>}
+        without "value", and the rest is meant to be read with iter_string_chunks(key, head).
+        """
         try:
             t = self.type(key)
-            t = t.decode("utf-8") if isinstance(t, bytes) else t
-            if t == "string":
+            if t == "string" and not stream:
                 val = self.client.get(key)
-                sval = _b2s(val)
-                # try parse json
-                try:
-                    return {"type": t, "key": key, "value": json.loads(sval)} if isinstance(sval, str) else {"type": t, "key": key, "value": sval}
-                except Exception:
-                    return {"type": t, "key": key, "value": sval}
-            elif t == "hash":
-                return {"type": t, "key": key, "value": _b2s(self.client.hgetall(key))}
+                return {"type": t, "key": key, "value": _parse_string_value(val) if parse_json else val}
+            if t == "string":
+                # One round trip for the length and the first _STREAM_VALUE_MIN bytes, which are the whole
+                # value unless it is longer (a value of exactly _STREAM_VALUE_MIN bytes still comes back
+                # complete). Read as bytes: a longer value's head can end inside a multi-byte character,
+                # so it is handed to the stream as "head" and decoded there together with the rest
+                pipe = self.raw.pipeline(transaction=False)
+                pipe.strlen(key)
+                pipe.getrange(key, 0, _STREAM_VALUE_MIN - 1)
+                size, head = pipe.execute()
+                if size > _STREAM_VALUE_MIN:
+                    return {"type": t, "key": key, "length": size, "streamed": True, "head": head}
+                val = head.decode("utf-8", "replace")
+                return {"type": t, "key": key, "value": _parse_string_value(val) if parse_json else val}
+            # Aggregates are capped at max_items; "truncated" marks a partial view
+            truncated = False
+            if t == "hash":
+                # HSCAN walks the hash incrementally instead of HGETALL materializing it server-side
+                value: Any = {}
+                for field, v in self.client.hscan_iter(key, count=max_items):
+                    if len(value) >= max_items and field not in value:
+                        truncated = True
+                        break
+                    value[field] = v
             elif t == "list":
-                return {"type": t, "key": key, "value": _b2s(self.client.lrange(key, 0, max_items - 1))}
+                # fetch one extra item to detect truncation
+                value = self.client.lrange(key, 0, max_items)
+                truncated = len(value) > max_items
+                del value[max_items:]
             elif t == "set":
-                return {"type": t, "key": key, "value": sorted(_b2s(list(self.client.smembers(key))))}
+                members = set()
+                for m in self.client.sscan_iter(key, count=max_items):
+                    if len(members) >= max_items and m not in members:
+                        truncated = True
+                        break
+                    members.add(m)
+                value = sorted(members)
             elif t == "zset":
-                data = self.client.zrange(key, 0, max_items - 1, withscores=True)
-                return {"type": t, "key": key, "value": [[_b2s(k), float(s)] for k, s in data]}
+                # ZRANGE is already bounded and keeps score order, unlike ZSCAN
+                data = self.client.zrange(key, 0, max_items, withscores=True)
+                truncated = len(data) > max_items
+                value = [[k, float(s)] for k, s in data[:max_items]]
             elif t == "stream":
                 # Show a small range
-                return {"type": t, "key": key, "value": _b2s(self.client.xrange(key, count=max_items))}
+                value = self.client.xrange(key, count=max_items + 1)
+                truncated = len(value) > max_items
+                del value[max_items:]
             elif t == "none":
                 return {"type": t, "key": key, "value": None}
             else:
                 # Fallback generic
                 val = self.client.get(key)
-                return {"type": t, "key": key, "value": _b2s(val)}
+                return {"type": t, "key": key, "value": val}
+            res = {"type": t, "key": key, "value": value}
+            if truncated:
+                res["truncated"] = True
+            return res
         except Exception as e:
             raise SimpleRedisClientError(str(e))
 
-    def set_value(self, key: str, value_text: str, value_type: str = "string") -> Dict[str, Any]:
+    def get_values_bulk(self, keys: List[str], max_items: int = 200) -> Dict[str, Dict[str, Any]]:
+        """Fetch many keys in two round trips; payloads have the same shape as get_value()."""
+        # Round trip 1: TYPE pipeline. Round trip 2: one MGET for all strings plus one
+        # bounded read per other key (hashes/sets get a single HSCAN/SSCAN page).
+        # Per-key failures are reported under "error" instead of failing the batch.
         try:
-            vt = value_type.lower()
-            if vt == "string":
-                # allow plain text or JSON
-                # if JSON, we store original string text
-                self.client.set(key, value_text.encode("utf-8"))
-                return {"acknowledged": True, "operation": "SET", "key": key}
-            elif vt == "hash":
-                data = json.loads(value_text)
-                if not isinstance(data, dict):
-                    raise ValueError("Hash value must be a JSON object")
-                # HMSET is deprecated; use HSET with mapping
-                self.client.hset(key, mapping={k: json.dumps(v) if isinstance(v, (dict, list)) else str(v) for k, v in data.items()})
-                return {"acknowledged": True, "operation": "HSET", "key": key, "fields": len(data)}
-            elif vt == "list":
-                data = json.loads(value_text)
-                if not isinstance(data, list):
-                    raise ValueError("List value must be a JSON array")
-                if data:
-                    # replace existing
-                    self.client.delete(key)
-                    self.client.rpush(key, *[json.dumps(v) if isinstance(v, (dict, list)) else str(v) for v in data])
-                return {"acknowledged": True, "operation": "RPUSH", "key": key, "length": len(data)}
-            elif vt == "set":
-                data = json.loads(value_text)
-                if not isinstance(data, list):
-                    raise ValueError("Set value must be a JSON array")
-                if data:
-                    self.client.delete(key)
-                    self.client.sadd(key, *[json.dumps(v) if isinstance(v, (dict, list)) else str(v) for v in data])
-                return {"acknowledged": True, "operation": "SADD", "key": key, "length": len(data)}
-            elif vt == "zset":
-                data = json.loads(value_text)
-                # Accept array of {"member":..., "score":...} or [[member, score], ...]
-                pairs: List[Tuple[str, float]] = []
-                if isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict):
-                            pairs.append((json.dumps(item.get("member")) if isinstance(item.get("member"), (dict, list)) else str(item.get("member")), float(item.get("score", 0))))
-                        else:
-                            member, score = item
-                            pairs.append((json.dumps(member) if isinstance(member, (dict, list)) else str(member), float(score)))
+            result: Dict[str, Dict[str, Any]] = {}
+            strings: List[str] = []
+            others: List[Tuple[str, str]] = []
+            for k, t in zip(keys, self._lookup_types(keys) if keys else []):
+                if isinstance(t, Exception):
+                    result[k] = {"type": None, "key": k, "error": str(t)}
+                elif t == "string":
+                    strings.append(k)
+                elif t in ("hash", "list", "set", "zset", "stream"):
+                    others.append((k, t))
                 else:
-                    raise ValueError("ZSet value must be an array of pairs or objects")
-                if pairs:
-                    self.client.delete(key)
-                    self.client.zadd(key, {m: s for m, s in pairs})
-                return {"acknowledged": True, "operation": "ZADD", "key": key, "length": len(pairs)}
-            else:
+                    result[k] = {"type": t, "key": k, "value": None}
+            if strings or others:
+                pipe = self.client.pipeline(transaction=False)
+                if strings:
+                    pipe.mget(strings)
+                for k, t in others:
+                    if t == "hash":
+                        pipe.hscan(k, 0, count=max_items)
+                    elif t == "list":
+                        pipe.lrange(k, 0, max_items)
+                    elif t == "set":
+                        pipe.sscan(k, 0, count=max_items)
+                    elif t == "zset":
+                        pipe.zrange(k, 0, max_items, withscores=True)
+                    else:
+                        pipe.xrange(k, count=max_items + 1)
+                replies = pipe.execute(raise_on_error=False)
+                if strings:
+                    values = replies.pop(0)
+                    if isinstance(values, Exception):
+                        for k in strings:
+                            result[k] = {"type": "string", "key": k, "error": str(values)}
+                    else:
+                        for k, v in zip(strings, values):
+                            result[k] = {"type": "string", "key": k, "value": _parse_string_value(v)}
+                for (k, t), reply in zip(others, replies):
+                    if isinstance(reply, Exception):
+                        result[k] = {"type": t, "key": k, "error": str(reply)}
+                        continue
+                    if t == "hash":
+                        cursor, fields = reply
+                        truncated = cursor != 0 or len(fields) > max_items
+                        value: Any = dict(list(fields.items())[:max_items])
+                    elif t == "set":
+                        cursor, members = reply
+                        truncated = cursor != 0 or len(members) > max_items
+                        value = sorted(set(members))[:max_items]
+                    elif t == "zset":
+                        truncated = len(reply) > max_items
+                        value = [[m, float(sc)] for m, sc in reply[:max_items]]
+                    else:
+                        truncated = len(reply) > max_items
+                        value = reply[:max_items]
+                    result[k] = {"type": t, "key": k, "value": value}
+                    if truncated:
+                        result[k]["truncated"] = True
+            return {k: result[k] for k in keys}
+        except Exception as e:
+            raise SimpleRedisClientError(str(e))
+
+    def set_value(self, key: str, value_text: str, value_type: str = "string") -> Dict[str, Any]:
+        self._type_cache.pop(key, None)
+        try:
+            setter = _SETTERS.get(value_type.lower())
+            if setter is None:
                 raise ValueError(f"Unsupported type: {value_type}")
+            return setter(self.client, key, value_text)
+        except Exception as e:
+            raise SimpleRedisClientError(str(e))
+
+    def iter_string_chunks(self, key: str, head: bytes = b"", chunk_size: int = _STREAM_CHUNK) -> Iterator[str]:
+        """Yield a string value as decoded text, reading chunk_size bytes per GETRANGE.
+
+        head holds bytes already read from the start of the value; reading resumes after them.
+        """
+        # byte offsets can split a multi-byte character; the incremental decoder carries it over
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        offset = len(head)
+        try:
+            if head:
+                yield decoder.decode(head)
+            while True:
+                data = self.raw.getrange(key, offset, offset + chunk_size - 1)
+                if not data:
+                    break
+                offset += len(data)
+                yield decoder.decode(data)
+                if len(data) < chunk_size:
+                    break
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
         except Exception as e:
             raise SimpleRedisClientError(str(e))
 
-    def scan(self, pattern: str = "*", type_filter: Optional[str] = None, count: int = 100) -> List[str]:
+    def get_msgpack(self, key: str) -> Dict[str, Any]:
+        """Read a string value and decode it as MessagePack."""
+        if msgpack is None:
+            raise SimpleRedisClientError("The 'msgpack' package is not installed.")
         try:
+            data = self.raw.get(key)
+            if data is None:
+                return {"type": "none", "key": key, "value": None}
+            try:
+                value = msgpack.unpackb(data, raw=False)
+            except Exception as e:
+                raise ValueError(f"Value is not valid MessagePack: {e}")
+            return {"type": "string", "key": key, "encoding": "msgpack", "value": value}
+        except Exception as e:
+            raise SimpleRedisClientError(str(e))
+
+    def set_msgpack(self, key: str, value_text: str) -> Dict[str, Any]:
+        """Store JSON text as a MessagePack-encoded string value."""
+        if msgpack is None:
+            raise SimpleRedisClientError("The 'msgpack' package is not installed.")
+        self._type_cache.pop(key, None)
+        try:
+            data = msgpack.packb(_json_loads(value_text), use_bin_type=True)
+            self.raw.set(key, data)
+            return {"acknowledged": True, "operation": "SET", "key": key, "encoding": "msgpack", "bytes": len(data)}
+        except Exception as e:
+            raise SimpleRedisClientError(str(e))
+
+    def _pipeline_types(self, keys: List[str]) -> List[Any]:
+        # Queue TYPE for the whole batch in one pipeline: a single round trip instead of one per key
+        pipe = self.client.pipeline(transaction=False)
+        for k in keys:
+            pipe.type(k)
+        return pipe.execute(raise_on_error=False)
+
+    def _lookup_types(self, keys: List[str]) -> List[Any]:
+        workers = min(_TYPE_FANOUT_WORKERS, len(keys) // _TYPE_FANOUT_CHUNK)
+        if workers < 2:
+            return self._pipeline_types(keys)
+        # Large batches: run one pipeline per chunk on separate pooled connections;
+        # redis-py releases the GIL while waiting on the socket, so the round trips overlap
+        size = -(-len(keys) // workers)
+        chunks = [keys[i:i + size] for i in range(0, len(keys), size)]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            return [t for part in executor.map(self._pipeline_types, chunks) for t in part]
+
+    def _split_cached_types(self, keys: List[str]) -> Tuple[Dict[str, str], List[str]]:
+        # Types seen earlier (e.g. when paginating the same pattern again) are served from the cache
+        cache = self._type_cache
+        types: Dict[str, str] = {}
+        missing: List[str] = []
+        for k in keys:
+            t = cache.get(k)
+            if t is None:
+                missing.append(k)
+            else:
+                types[k] = t
+        return types, missing
+
+    def _remember_types(self, types: Dict[str, str], keys: List[str], replies: List[Any]):
+        cache = self._type_cache
+        for k, t in zip(keys, replies):
+            # keys whose TYPE failed come back as exceptions and are skipped
+            if isinstance(t, Exception):
+                continue
+            types[k] = t
+            if t != "none":
+                if len(cache) >= _TYPE_CACHE_MAX:
+                    del cache[next(iter(cache))]  # FIFO eviction
+                cache[k] = t
+
+    def _filter_by_type(self, keys: List[str], type_filter: str) -> List[str]:
+        types, missing = self._split_cached_types(keys)
+        if missing:
+            self._remember_types(types, missing, self._lookup_types(missing))
+        return [k for k in keys if types.get(k) == type_filter]
+
+    def _scan_post_filtered(self, cursor: int, pattern: str, count: int, need: int, type_filter: str) -> Tuple[List[str], int]:
+        # Without SCAN TYPE, each pipeline carries the TYPE lookups for the batch in hand together
+        # with the next SCAN hop, so a page costs one round trip per hop instead of two
+        cursor, pending = self.client.scan(cursor=cursor, match=pattern, count=count)
+        keys: List[str] = []
+        while True:
+            types, missing = self._split_cached_types(pending)
+            pipe = self.client.pipeline(transaction=False)
+            for k in missing:
+                pipe.type(k)
+            scan_ahead = cursor != 0
+            if scan_ahead:
+                pipe.scan(cursor=cursor, match=pattern, count=count)
+            replies = pipe.execute(raise_on_error=False)
+            self._remember_types(types, missing, replies[:len(missing)])
+            keys += [k for k in pending if types.get(k) == type_filter]
+            if not scan_ahead or len(keys) >= need:
+                # the read-ahead hop is discarded and its start cursor returned, so no key is skipped
+                return keys, cursor
+            if isinstance(replies[-1], Exception):
+                raise replies[-1]
+            cursor, pending = replies[-1]
+
+    def _scan_typed(self, cursor: int, pattern: str, count: int, type_filter: str) -> Tuple[int, List[str]]:
+        # One SCAN hop filtered by type; server-side when SCAN TYPE is supported (probed once per client)
+        if self._scan_supports_type is not False:
+            try:
+                cursor, batch = self.client.scan(cursor=cursor, match=pattern, count=count, _type=type_filter)
+                self._scan_supports_type = True
+                return cursor, batch
+            except (TypeError, redis.exceptions.ResponseError) as e:
+                # Older redis-py (TypeError) or server (ERR syntax error) without TYPE in SCAN;
+                # other replies (NOPERM, ...) are real errors and leave the probe undecided
+                if self._scan_supports_type or (
+                        isinstance(e, redis.exceptions.ResponseError) and not _SCAN_TYPE_UNSUPPORTED.search(str(e))):
+                    raise
+                self._scan_supports_type = False
+        cursor, batch = self.client.scan(cursor=cursor, match=pattern, count=count)
+        return cursor, self._filter_by_type(batch, type_filter)
+
+    def _exact_match(self, key: str, type_filter: Optional[str]) -> List[str]:
+        # A pattern without glob metacharacters names a single key: one EXISTS/TYPE instead of a full SCAN
+        if type_filter and type_filter.lower() != "all":
+            return [key] if self.client.type(key) == type_filter else []
+        return [key] if self.client.exists(key) else []
+
+    def scan(self, pattern: str = "*", type_filter: Optional[str] = None, count: int = 100, page: int = 1000) -> List[str]:
+        # count caps the number of keys returned; page is the per-hop SCAN COUNT hint,
+        # large enough to keep the number of round trips low on sparse matches
+        try:
+            if not _GLOB_META.search(pattern):
+                return self._exact_match(pattern, type_filter)[:count]
+            self._type_cache.clear()
             cursor = 0
             keys: List[str] = []
+            typed = bool(type_filter) and type_filter.lower() != "all"
             # Use low-level scan to support type filter where available
             while True:
-                if type_filter and type_filter.lower() != "all":
-                    cursor, batch = self.client.scan(cursor=cursor, match=pattern, count=count, _type=type_filter)
+                if typed:
+                    cursor, batch = self._scan_typed(cursor, pattern, page, type_filter)
                 else:
-                    cursor, batch = self.client.scan(cursor=cursor, match=pattern, count=count)
-                keys.extend([_b2s(k) for k in batch])
+                    cursor, batch = self.client.scan(cursor=cursor, match=pattern, count=page)
+                keys += batch
                 if cursor == 0 or len(keys) >= count:
                     break
-            return keys[:count]
-        except TypeError:
-            # Older redis servers don't support TYPE in SCAN
-            try:
-                cursor = 0
-                keys: List[str] = []
-                while True:
-                    cursor, batch = self.client.scan(cursor=cursor, match=pattern, count=count)
-                    keys.extend([_b2s(k) for k in batch])
-                    if cursor == 0 or len(keys) >= count:
-                        break
-                if type_filter and type_filter.lower() != "all":
-                    # post-filter by TYPE
-                    filtered = []
-                    for k in keys:
-                        try:
-                            if self.type(k) == type_filter:
-                                filtered.append(k)
-                        except Exception:
-                            pass
-                    return filtered[:count]
-                return keys[:count]
-            except Exception as e:
-                raise SimpleRedisClientError(str(e))
+            del keys[count:]
+            return keys
         except Exception as e:
             raise SimpleRedisClientError(str(e))
 
     def scan_with_cursor(self, pattern: str = "*", type_filter: Optional[str] = None, count: int = 100, cursor: int = 0) -> Tuple[List[str], int]:
         try:
+            if cursor == 0:
+                # a new scan: types remembered from earlier scans may be stale
+                self._type_cache.clear()
+                if not _GLOB_META.search(pattern):
+                    return self._exact_match(pattern, type_filter)[:count], 0
             keys: List[str] = []
             next_cursor = cursor
+            typed = bool(type_filter) and type_filter.lower() != "all"
             while len(keys) < count:
-                if type_filter and type_filter.lower() != "all":
-                    next_cursor, batch = self.client.scan(cursor=next_cursor, match=pattern, count=count, _type=type_filter)
+                if typed and self._scan_supports_type is False:
+                    batch, next_cursor = self._scan_post_filtered(next_cursor, pattern, count, count - len(keys), type_filter)
+                    keys += batch
+                    break
+                if typed:
+                    next_cursor, batch = self._scan_typed(next_cursor, pattern, count, type_filter)
                 else:
                     next_cursor, batch = self.client.scan(cursor=next_cursor, match=pattern, count=count)
-                keys.extend([_b2s(k) for k in batch])
+                keys += batch
                 if next_cursor == 0:
                     break
-            return keys[:count], int(next_cursor)
-        except TypeError:
-            # Fallback for servers without TYPE support in SCAN
-            try:
-                keys: List[str] = []
-                next_cursor = cursor
-                while len(keys) < count:
-                    next_cursor, batch = self.client.scan(cursor=next_cursor, match=pattern, count=count)
-                    batch_keys = [_b2s(k) for k in batch]
-                    if type_filter and type_filter.lower() != "all":
-                        for k in batch_keys:
-                            try:
-                                if self.type(k) == type_filter:
-                                    keys.append(k)
-                            except Exception:
-                                pass
-                    else:
-                        keys.extend(batch_keys)
-                    if next_cursor == 0:
-                        break
-                return keys[:count], int(next_cursor)
-            except Exception as e:
-                raise SimpleRedisClientError(str(e))
+            # Not trimmed to count: the cursor is already past every key returned here,
+            # so trimming would silently drop keys between pages
+            return keys, int(next_cursor)
         except Exception as e:
             raise SimpleRedisClientError(str(e))
 
     def custom(self, parts: List[str]):
         try:
-            # Execute arbitrary command
+            # Execute arbitrary command; it may change any key, so forget cached types
+            self._type_cache.clear()
             cmd = parts[0]
             args = parts[1:]
-            res = self.client.execute_command(cmd, *args)
-            return _b2s(res)
+            return self.client.execute_command(cmd, *args)
+        except Exception as e:
+            raise SimpleRedisClientError(str(e))
+
+    def pipeline(self, commands: List[List[str]]) -> List[Any]:
+        """Send several commands in one round trip; a failed command's reply is {"error": message}."""
+        try:
+            self._type_cache.clear()
+            with self.client.pipeline(transaction=False) as pipe:
+                for parts in commands:
+                    pipe.execute_command(*parts)
+                replies = pipe.execute(raise_on_error=False)
+            return [{"error": str(r)} if isinstance(r, Exception) else r for r in replies]
         except Exception as e:
             raise SimpleRedisClientError(str(e))
 
@@ -365,15 +773,436 @@ class SimpleRedisClient:
 #  UI Presentation Layer: PyQt Application
 # ==============================================================================
 
+class _TaskSignals(QObject):
+    done = pyqtSignal(object)
+    # message, and whether the connection itself failed (as opposed to e.g. a WRONGTYPE reply)
+    failed = pyqtSignal(str, bool)
+    page = pyqtSignal(object)
+
+
+class RedisTask(QRunnable):
+    """Run a blocking Redis call on the global thread pool and report back via queued signals."""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = _TaskSignals()
+        # set from the GUI thread; the running call is not interrupted, its result is just dropped
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        try:
+            res = self.fn()
+        except Exception as e:
+            self.signals.failed.emit(str(e), _is_connection_error(e))
+            return
+        self.signals.done.emit(res)
+
+
+# Streaming scan: COUNT doubles up to _SCAN_COUNT_MAX while a hop takes under _SCAN_FAST_HOP seconds,
+# and the walk stops on its own after _SCAN_STREAM_CAP keys (Next carries on from there)
+_SCAN_COUNT_MAX = 10000
+_SCAN_FAST_HOP = 0.05
+_SCAN_STREAM_CAP = 100_000
+# Keys list upper bound; beyond it the oldest rows are dropped as new pages arrive
+MAX_KEYS_IN_MEMORY = 200_000
+
+
+class ScanStreamTask(RedisTask):
+    """Walk SCAN pages back to back, emitting (keys, cursor) per page; the result is (total, cursor)."""
+
+    def __init__(self, client: SimpleRedisClient, pattern: str, type_filter: Optional[str], count: int):
+        super().__init__(self._stream)
+        self.client = client
+        self.pattern = pattern
+        self.type_filter = type_filter
+        self.count = count
+
+    def _stream(self) -> Tuple[int, int]:
+        cursor, total, count = 0, 0, self.count
+        while not self.cancelled:
+            started = time.monotonic()
+            keys, cursor = self.client.scan_with_cursor(pattern=self.pattern, type_filter=self.type_filter, count=count, cursor=cursor)
+            if time.monotonic() - started < _SCAN_FAST_HOP:
+                count = min(count * 2, max(_SCAN_COUNT_MAX, self.count))
+            total += len(keys)
+            self.signals.page.emit((keys, cursor))
+            if cursor == 0 or total >= _SCAN_STREAM_CAP:
+                break
+        return total, cursor
+
+
+class StringStreamTask(RedisTask):
+    """Read a large string value chunk by chunk, emitting each decoded chunk; the result is its length."""
+
+    def __init__(self, client: SimpleRedisClient, key: str, head: bytes = b""):
+        super().__init__(self._stream)
+        self.client = client
+        self.key = key
+        self.head = head
+
+    def _stream(self) -> int:
+        total = 0
+        head, self.head = self.head, b""
+        for chunk in self.client.iter_string_chunks(self.key, head):
+            if self.cancelled:
+                break
+            total += len(chunk)
+            self.signals.page.emit(chunk)
+        return total
+
+
+class KeysListModel(QAbstractListModel):
+    """Flat list of key names with a substring filter; scan pages land as one row insertion each.
+
+    Filtering runs over a lowercased copy of the keys kept in lockstep, as one list comprehension;
+    a QSortFilterProxyModel would call back into data() for every row on every refilter.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._keys: List[str] = []
+        self._lower: List[str] = []
+        self._needle = ""
+        # rows currently visible; the very same list as _keys while no filter is set
+        self._shown: List[str] = self._keys
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._shown)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self._shown[index.row()]
+        return None
+
+    def total(self) -> int:
+        return len(self._keys)
+
+    def _matching(self, keys: List[str], lower: List[str]) -> List[str]:
+        needle = self._needle
+        return [k for k, kl in zip(keys, lower) if needle in kl]
+
+    def set_filter(self, needle: str):
+        """Show only keys containing needle (already lowercased); empty shows all."""
+        self.beginResetModel()
+        previous, self._needle = self._needle, needle
+        if not needle:
+            self._shown = self._keys
+        elif previous and previous in needle and len(self._shown) * 2 < len(self._keys):
+            # typing further only narrows the match: re-test the (small) visible subset instead of every key
+            self._shown = [k for k in self._shown if needle in k.lower()]
+        else:
+            self._shown = self._matching(self._keys, self._lower)
+        self.endResetModel()
+
+    def _refilter(self):
+        # _keys changed underneath the filter: rebuild from all keys, the visible subset may be stale
+        self.beginResetModel()
+        self._shown = self._matching(self._keys, self._lower)
+        self.endResetModel()
+
+    def reset(self, keys: List[str]):
+        self.beginResetModel()
+        self._keys = list(keys)
+        self._lower = [k.lower() for k in self._keys]
+        self._shown = self._matching(self._keys, self._lower) if self._needle else self._keys
+        self.endResetModel()
+
+    def append_page(self, keys: List[str]):
+        if not keys:
+            return
+        lower = [k.lower() for k in keys]
+        added = self._matching(keys, lower) if self._needle else keys
+        first = len(self._shown)
+        if added:
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+        self._keys.extend(keys)
+        self._lower.extend(lower)
+        if self._shown is not self._keys:
+            self._shown.extend(added)
+        if added:
+            self.endInsertRows()
+
+    def drop_first(self, count: int):
+        count = min(count, len(self._keys))
+        if count <= 0:
+            return
+        if self._shown is not self._keys:
+            del self._keys[:count]
+            del self._lower[:count]
+            self._refilter()
+            return
+        self.beginRemoveRows(QModelIndex(), 0, count - 1)
+        del self._keys[:count]
+        del self._lower[:count]
+        self.endRemoveRows()
+
+    def remove_keys(self, keys: List[str]):
+        gone = set(keys)
+        filtered = self._shown is not self._keys
+        if filtered:
+            kept = [(k, kl) for k, kl in zip(self._keys, self._lower) if k not in gone]
+            self._keys = [k for k, _ in kept]
+            self._lower = [kl for _, kl in kept]
+        rows = [i for i, k in enumerate(self._shown) if k in gone]
+        # one removeRows per contiguous run, last run first so earlier rows keep their index
+        while rows:
+            last = rows.pop()
+            first = last
+            while rows and rows[-1] == first - 1:
+                first = rows.pop()
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._shown[first:last + 1]
+            if not filtered:
+                del self._lower[first:last + 1]
+            self.endRemoveRows()
+
+
+# Result rows are handed to the view this many at a time (canFetchMore/fetchMore)
+_RESULT_FETCH_BATCH = 1000
+
+
+class _ResultNode:
+    """One row of a RedisResultModel; child nodes are created the first time a view asks for them."""
+    __slots__ = ("key", "value", "parent", "row", "fetched", "_entries", "_children")
+
+    def __init__(self, key: str, value: Any, parent: Optional["_ResultNode"], row: int):
+        self.key = key
+        self.value = value
+        self.parent = parent
+        self.row = row
+        # children exposed to the view so far
+        self.fetched = 0
+        self._entries = None
+        self._children = None
+
+    def child_count(self) -> int:
+        return len(self.value) if isinstance(self.value, (dict, list)) else 0
+
+    def child(self, row: int) -> "_ResultNode":
+        if self._children is None:
+            self._children = [None] * self.child_count()
+            # dict rows are addressed by position, so snapshot the items once
+            if isinstance(self.value, dict):
+                self._entries = list(self.value.items())
+        node = self._children[row]
+        if node is None:
+            if self._entries is not None:
+                key, value = self._entries[row]
+                key = str(key)
+            else:
+                key, value = f"[{row}]", self.value[row]
+            node = self._children[row] = _ResultNode(key, value, self, row)
+        return node
+
+
+class RedisResultModel(QAbstractItemModel):
+    """Key/Value tree over a result's dicts and lists, read in place instead of copied into items."""
+
+    _FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def __init__(self, data: Any, parent=None):
+        super().__init__(parent)
+        # a bare scalar shows as a single "value" row
+        self._root = _ResultNode("", data if isinstance(data, (dict, list)) else {"value": data}, None, 0)
+        # the first batch of top-level rows is there from the start; everything else is fetched on demand
+        self._root.fetched = min(self._root.child_count(), _RESULT_FETCH_BATCH)
+
+    def _node(self, index: QModelIndex) -> _ResultNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self._node(parent)
+        if not (0 <= row < node.fetched and 0 <= column < 2):
+            return QModelIndex()
+        return self.createIndex(row, column, node.child(row))
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        up = index.internalPointer().parent
+        if up is None or up is self._root:
+            return QModelIndex()
+        return self.createIndex(up.row, 0, up)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return self._node(parent).fetched
+
+    def hasChildren(self, parent=QModelIndex()):
+        # containers get an expand arrow before any of their rows are fetched
+        if parent.column() > 0:
+            return False
+        return self._node(parent).child_count() > 0
+
+    def canFetchMore(self, parent):
+        if parent.column() > 0:
+            return False
+        node = self._node(parent)
+        return node.fetched < node.child_count()
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        first = node.fetched
+        last = min(node.child_count(), first + _RESULT_FETCH_BATCH) - 1
+        if last < first:
+            return
+        self.beginInsertRows(parent, first, last)
+        node.fetched = last + 1
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 2
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        node = index.internalPointer()
+        if index.column() == 0:
+            return node.key
+        # containers show their children instead of a value
+        return None if isinstance(node.value, (dict, list)) else str(node.value)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return ("Key", "Value")[section]
+        return None
+
+    def flags(self, index):
+        return self._FLAGS if index.isValid() else Qt.ItemFlag.NoItemFlags
+
+
+# Server tab operations: (category, ((label, item data), ...)).
+# "op" entries run a client method directly; "cmd" entries are preloaded into the console.
+# Double-clicking a category runs all of its entries in one pipeline.
+_QUICK_QUERY_TREE = (
+    ("🌐 Server", (
+        ("INFO", {"op": "info"}),
+        ("DBSIZE", {"op": "dbsize"}),
+    )),
+    ("👥 Client", (
+        ("CLIENT LIST", {"cmd": "CLIENT LIST"}),
+        ("SLOWLOG GET 10", {"cmd": "SLOWLOG GET 10"}),
+        ("CONFIG GET *", {"cmd": "CONFIG GET *"}),
+    )),
+)
+
+# Console commands containing any of these are parsed with shlex
+_SHELL_QUOTING = re.compile(r"[\"'\\]")
+
+# Stylesheets per theme ("System" uses none)
+_THEME_QSS = {
+    "Dark": """
+        QGroupBox { font-weight: 600; border: 1px solid #3c3c3c; border-radius: 6px; margin-top: 6px; }
+        QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 4px; }
+        QLineEdit, QComboBox, QPlainTextEdit { border: 1px solid #3c3c3c; border-radius: 4px; padding: 4px; }
+        QPushButton { padding: 4px 10px; border: 1px solid #3c3c3c; border-radius: 4px; }
+        QPushButton:hover { border-color: #2a82da; }
+    """,
+    "Light": """
+        QGroupBox { font-weight: 600; border: 1px solid #e0e0e0; border-radius: 6px; margin-top: 6px; }
+        QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 4px; }
+        QLineEdit, QComboBox, QPlainTextEdit { border: 1px solid #d0d0d0; border-radius: 4px; padding: 4px; }
+        QPushButton { padding: 4px 10px; border: 1px solid #d0d0d0; border-radius: 4px; }
+        QPushButton:hover { border-color: #2a82da; }
+    """,
+}
+
+# Results up to this many nodes (long strings count one per 100 chars) are pretty-printed on the GUI thread
+_FORMAT_SYNC_BUDGET = 5000
+
+
+def _fits_format_budget(obj: Any, budget: int = _FORMAT_SYNC_BUDGET) -> bool:
+    # Walk only as far as the budget allows, so a huge result is rejected after a few checks
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        budget -= 1
+        if isinstance(o, dict):
+            budget -= len(o)  # the keys
+            if len(o) > budget:
+                return False
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple)):
+            if len(o) > budget:
+                return False
+            stack.extend(o)
+        elif isinstance(o, (str, bytes)):
+            budget -= len(o) // 100
+        if budget < 0:
+            return False
+    return True
+
+
+# copy_value_only: result fields holding "the value", in order of preference
+_VALUE_KEYS = ("value", "result", "keys", "data")
+
+# Result containers with more rows than this are not auto-expanded into
+_EXPAND_CHILD_LIMIT = 500
+
+# A cached client is re-pinged before reuse once it has been idle this long (seconds)
+_PING_STALE_AFTER = 5.0
+
+# Command sent for each "op" when quick queries are pipelined
+_QUICK_OP_COMMANDS = {"info": ["INFO"], "dbsize": ["DBSIZE"]}
+
+# "Refresh Server Stats": (result key, command), sent as one pipeline
+_SERVER_STATS_COMMANDS = (
+    ("info", ["INFO"]),
+    ("dbsize", ["DBSIZE"]),
+    ("clients", ["CLIENT", "LIST"]),
+)
+
+# Window-wide keyboard shortcuts: (key sequence, RedisViewer slot name)
+SHORTCUTS = [
+    ("F5", "execute_scan"),
+    ("F6", "execute_scan_next"),
+    ("F9", "execute_get_value"),
+    ("Ctrl+S", "execute_set_value"),
+    ("Del", "execute_delete_key"),
+    ("Ctrl+T", "execute_ttl"),
+    ("Ctrl+E", "execute_expire"),
+    ("Ctrl+Shift+F", "format_json_value"),
+    ("Ctrl+Shift+C", "copy_full_json"),
+    ("Ctrl+Alt+C", "copy_value_only"),
+]
+
+
 class RedisViewer(QMainWindow):
+    # standard icons, resolved through the style once per process
+    _ICON_CACHE: Dict[QStyle.StandardPixmap, QIcon] = {}
+    _PALETTE_CACHE: Dict[str, QPalette] = {}
+
     def __init__(self):
         super().__init__()
+        # theme currently set on the application, None until apply_theme() runs
+        self._applied_theme: Optional[str] = None
+        # built from the connection fields; dropped as soon as any of them is edited
         self.redis_client: Optional[SimpleRedisClient] = None
+        # time.monotonic() of the last ping or task that proved redis_client alive
+        self._last_ping_ts: float = 0.0
+        # running RedisTasks, kept referenced until their result has been delivered
+        self._tasks: set = set()
+        # newest task per _run_latest() name; an older one still running is cancelled
+        self._latest_tasks: Dict[str, RedisTask] = {}
         self.connections: List[Dict[str, Any]] = []
         # pagination state
         self._scan_cursor: int = 0
         self._last_scan_params: Dict[str, Any] = {"pattern": "*", "type": "All", "count": 100}
-        self._keys_all: List[str] = []
+        # scan/next page currently running, if any
+        self._scan_task: Optional[RedisTask] = None
+        # last result shown, and its JSON text once something needed it (None = not rendered yet)
+        self._pending_data: Any = None
+        self._json_cache: Optional[str] = ""
+        self._json_shown = True
+        # whether results_tree shows _pending_data yet
+        self._tree_shown = True
+        # settings last written to QSettings, serialized
+        self._last_saved_snapshot: Optional[str] = None
         self.init_ui()
         self.load_settings()
 
@@ -397,14 +1226,16 @@ class RedisViewer(QMainWindow):
         connection_management_layout = QHBoxLayout()
         self.connection_combo = QComboBox()
         self.connection_combo.setEditable(True)
+        self._conn_model = QStringListModel(self)
+        self.connection_combo.setModel(self._conn_model)
         self.connection_combo.setPlaceholderText("Enter new connection name or select existing")
         self.save_connection_button = QPushButton("Save")
         self.delete_connection_button = QPushButton("Delete")
         self.test_connection_button = QPushButton("Test")
         # Standard icons (consistent with OS theme)
-        self.save_connection_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton))
-        self.delete_connection_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon))
-        self.test_connection_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton))
+        self.save_connection_button.setIcon(self._icon(QStyle.StandardPixmap.SP_DialogSaveButton))
+        self.delete_connection_button.setIcon(self._icon(QStyle.StandardPixmap.SP_TrashIcon))
+        self.test_connection_button.setIcon(self._icon(QStyle.StandardPixmap.SP_DialogApplyButton))
         connection_management_layout.addWidget(QLabel("Connection:"))
         connection_management_layout.addWidget(self.connection_combo, 1)
         connection_management_layout.addWidget(self.save_connection_button)
@@ -452,6 +1283,11 @@ class RedisViewer(QMainWindow):
         self.save_connection_button.clicked.connect(self.save_connection)
         self.delete_connection_button.clicked.connect(self.delete_connection)
         self.test_connection_button.clicked.connect(self.test_connection)
+        # Any edit to the connection fields invalidates the cached client
+        for field in (self.host_input, self.port_input, self.db_input, self.user_input, self.pass_input):
+            field.textChanged.connect(self._drop_client)
+        for box in (self.https_checkbox, self.verify_ssl_checkbox, self.auth_checkbox):
+            box.toggled.connect(self._drop_client)
 
         main_layout.addWidget(connection_group)
 
@@ -470,10 +1306,10 @@ class RedisViewer(QMainWindow):
         self.tabs.addTab(self.tab_server, "📊 Server")
         # Set consistent tab icons
         try:
-            self.tabs.setTabIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon))
-            self.tabs.setTabIcon(1, self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon))
-            self.tabs.setTabIcon(2, self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
-            self.tabs.setTabIcon(3, self.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon))
+            self.tabs.setTabIcon(0, self._icon(QStyle.StandardPixmap.SP_DirIcon))
+            self.tabs.setTabIcon(1, self._icon(QStyle.StandardPixmap.SP_FileIcon))
+            self.tabs.setTabIcon(2, self._icon(QStyle.StandardPixmap.SP_MediaPlay))
+            self.tabs.setTabIcon(3, self._icon(QStyle.StandardPixmap.SP_ComputerIcon))
         except Exception:
             pass
 
@@ -488,8 +1324,10 @@ class RedisViewer(QMainWindow):
         self.scan_button = QPushButton('Scan')
         self.scan_next_button = QPushButton('Next ▶')
         self.scan_next_button.setEnabled(False)
+        self.scan_cancel_button = QPushButton('Cancel')
+        self.scan_cancel_button.setEnabled(False)
         self.scan_status_label = QLabel('Cursor: 0')
-        for w in [QLabel("Pattern:"), self.pattern_input, QLabel("Type:"), self.type_combo, QLabel("Count:"), self.count_input, self.scan_button, self.scan_next_button, self.scan_status_label]:
+        for w in [QLabel("Pattern:"), self.pattern_input, QLabel("Type:"), self.type_combo, QLabel("Count:"), self.count_input, self.scan_button, self.scan_next_button, self.scan_cancel_button, self.scan_status_label]:
             pattern_layout.addWidget(w)
         pattern_layout.addStretch()
         # Group box for keys area
@@ -503,18 +1341,117 @@ class RedisViewer(QMainWindow):
         filter_layout.addWidget(QLabel("Filter:"))
         filter_layout.addWidget(self.keys_filter_input)
         keys_box_layout.addLayout(filter_layout)
-        self.keys_list = QListWidget()
+        self._keys_model = KeysListModel(self)
+        self._keys_filter_text = ""
+        self.keys_list = QListView()
+        self.keys_list.setModel(self._keys_model)
+        self.keys_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.keys_list.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
         self.keys_list.setAlternatingRowColors(True)
+        # one size hint for all rows, so layout doesn't measure each key
+        self.keys_list.setUniformItemSizes(True)
         keys_box_layout.addWidget(self.keys_list)
         keys_layout.addWidget(keys_box)
         self.scan_button.clicked.connect(self.execute_scan)
         self.scan_next_button.clicked.connect(self.execute_scan_next)
-        self.keys_list.itemDoubleClicked.connect(self.open_key_from_list)
+        self.scan_cancel_button.clicked.connect(self.cancel_scan)
+        self.keys_list.doubleClicked.connect(self.open_key_from_list)
         self.keys_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.keys_list.customContextMenuRequested.connect(self.open_keys_list_menu)
-        self.keys_filter_input.textChanged.connect(self.filter_keys_list)
+        # coalesce keystrokes/pastes so only the settled text refilters
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_keys_filter)
+        self.keys_filter_input.textChanged.connect(lambda _t: self._filter_timer.start())
+
+        # The other tabs are filled in the first time they are shown (or an action needs them)
+        self._tab_builders = {
+            self.tabs.indexOf(self.tab_editor): self._build_editor_tab,
+            self.tabs.indexOf(self.tab_console): self._build_console_tab,
+            self.tabs.indexOf(self.tab_server): self._build_server_tab,
+        }
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
 
-        # --- Key Editor Tab ---
+        # Results panel (as group box)
+        results_box = QGroupBox("Results")
+        results_layout = QVBoxLayout(results_box)
+        results_layout.setContentsMargins(10, 8, 10, 8)
+
+        display_toggle_layout = QHBoxLayout()
+        display_toggle_layout.addWidget(QLabel("Results:")); display_toggle_layout.addStretch()
+        self.view_mode_combo = QComboBox(); self.view_mode_combo.addItems(["JSON Text", "Tree View"])  
+        self.view_mode_combo.currentTextChanged.connect(self.toggle_display_mode)
+        display_toggle_layout.addWidget(QLabel("Display Mode:")); display_toggle_layout.addWidget(self.view_mode_combo)
+        # Add copy actions
+        self.copy_json_btn = QPushButton("Copy JSON")
+        self.copy_value_btn = QPushButton("Copy Value")
+        self.copy_json_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_DialogSaveButton))
+        self.copy_value_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_FileDialogToParent))
+        self.copy_json_btn.setToolTip("Copy full JSON (Ctrl+Shift+C)")
+        self.copy_value_btn.setToolTip("Copy only value (Ctrl+Alt+C)")
+        display_toggle_layout.addWidget(self.copy_json_btn)
+        display_toggle_layout.addWidget(self.copy_value_btn)
+        self.copy_json_btn.clicked.connect(self.copy_full_json)
+        self.copy_value_btn.clicked.connect(self.copy_value_only)
+        results_layout.addLayout(display_toggle_layout)
+
+        # QPlainTextEdit without wrapping: large JSON lays out line by line instead of as rich text
+        self.results_text = QPlainTextEdit(); self.results_text.setFont(QFont("Consolas", 10)); self.results_text.setReadOnly(True)
+        self.results_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        results_layout.addWidget(self.results_text)
+        self.results_tree = QTreeView(); self.results_tree.hide(); results_layout.addWidget(self.results_tree)
+        self.results_tree.setAlternatingRowColors(True)
+        self.results_tree.setUniformRowHeights(True)
+        try:
+            header = self.results_tree.header()
+            header.setStretchLastSection(True)
+            header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        except Exception:
+            pass
+        # Rows keep the result's own order; sorting only starts once a header is clicked
+        self._results_proxy: Optional[QSortFilterProxyModel] = None
+        self.results_tree.header().setSectionsClickable(True)
+        self.results_tree.header().sectionClicked.connect(self._enable_results_sorting)
+
+        main_splitter.addWidget(self.tabs)
+        main_splitter.addWidget(results_box)
+        main_splitter.setSizes([560, 720])
+        main_layout.addWidget(main_splitter)
+
+        self.status_bar = QStatusBar(); self.setStatusBar(self.status_bar)
+        self.setup_copy_functionality()
+        # Theme apply
+        self.theme_combo.currentTextChanged.connect(self.apply_theme)
+        self.theme_combo.currentTextChanged.connect(lambda _t: self.save_settings())
+        self.pattern_input.editingFinished.connect(self.save_settings)
+
+        # Add shortcut hints/tooltips
+        self.scan_button.setToolTip("Scan (F5)")
+        self.scan_next_button.setToolTip("Next page (F6)")
+        # Keyboard shortcuts
+        for seq, slot in SHORTCUTS:
+            QShortcut(QKeySequence(seq), self, activated=getattr(self, slot))
+
+    def _icon(self, sp: QStyle.StandardPixmap) -> QIcon:
+        ic = RedisViewer._ICON_CACHE.get(sp)
+        if ic is None:
+            ic = RedisViewer._ICON_CACHE[sp] = self.style().standardIcon(sp)
+        return ic
+
+    # --- Lazily built tabs ---
+    def _ensure_tab_built(self, index: int):
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            builder()
+
+    def _ensure_editor(self):
+        self._ensure_tab_built(self.tabs.indexOf(self.tab_editor))
+
+    def _ensure_console(self):
+        self._ensure_tab_built(self.tabs.indexOf(self.tab_console))
+
+    def _build_editor_tab(self):
         editor_layout = QVBoxLayout(self.tab_editor)
         editor_layout.setContentsMargins(10, 10, 10, 10)
         editor_layout.setSpacing(8)
@@ -523,9 +1460,13 @@ class RedisViewer(QMainWindow):
         self.value_type_combo = QComboBox(); self.value_type_combo.addItems(["string", "hash", "list", "set", "zset"])
         editor_form.addRow("Key:", self.key_input)
         editor_form.addRow("Type:", self.value_type_combo)
+        # How string values are read/written: verbatim text, JSON parsed for display, or MessagePack bytes
+        self.value_format_combo = QComboBox(); self.value_format_combo.addItems(["Raw", "JSON", "MsgPack"])
+        self.value_format_combo.setCurrentText("JSON")
+        editor_form.addRow("Format:", self.value_format_combo)
         editor_layout.addLayout(editor_form)
         editor_layout.addWidget(QLabel("Value"))
-        self.value_text = QTextEdit(); self.value_text.setFont(QFont("Consolas", 10)); self.value_text.setMinimumHeight(120)
+        self.value_text = QPlainTextEdit(); self.value_text.setFont(QFont("Consolas", 10)); self.value_text.setMinimumHeight(120)
         self.value_text.setPlaceholderText("String: plain text or JSON\nHash/List/Set/ZSet: JSON")
         editor_layout.addWidget(self.value_text)
         editor_buttons = QHBoxLayout()
@@ -548,8 +1489,14 @@ class RedisViewer(QMainWindow):
         self.btn_ttl.clicked.connect(self.execute_ttl)
         self.btn_expire.clicked.connect(self.execute_expire)
         self.btn_format.clicked.connect(self.format_json_value)
+        self.btn_get.setToolTip("Get (F9)")
+        self.btn_set.setToolTip("Set/Update (Ctrl+S)")
+        self.btn_delete.setToolTip("Delete (Del)")
+        self.btn_ttl.setToolTip("TTL (Ctrl+T)")
+        self.btn_expire.setToolTip("Expire (Ctrl+E)")
+        self.btn_format.setToolTip("Format JSON (Ctrl+Shift+F)")
 
-        # --- Command Console Tab ---
+    def _build_console_tab(self):
         console_layout = QVBoxLayout(self.tab_console)
         console_layout.setContentsMargins(10, 10, 10, 10)
         console_layout.setSpacing(8)
@@ -558,93 +1505,34 @@ class RedisViewer(QMainWindow):
         console_form.addRow("Command:", self.command_input)
         console_layout.addLayout(console_form)
         self.execute_command_button = QPushButton('Execute')
-        self.execute_command_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+        self.execute_command_button.setIcon(self._icon(QStyle.StandardPixmap.SP_MediaPlay))
         self.execute_command_button.setSizePolicy(self.execute_command_button.sizePolicy().horizontalPolicy(), QSizePolicy.Policy.Fixed)
         self.execute_command_button.clicked.connect(self.execute_custom_command)
         console_layout.addWidget(self.execute_command_button, 0, Qt.AlignmentFlag.AlignRight)
         self.command_input.returnPressed.connect(self.execute_custom_command)
         QShortcut(QKeySequence("Ctrl+Return"), self.tab_console, activated=self.execute_custom_command)
         QShortcut(QKeySequence("Ctrl+Enter"), self.tab_console, activated=self.execute_custom_command)
+        self.execute_command_button.setToolTip("Execute (Ctrl+Enter)")
 
-        # --- Server Tab ---
+    def _build_server_tab(self):
         server_layout = QVBoxLayout(self.tab_server)
         server_layout.setContentsMargins(10, 10, 10, 10)
         server_layout.setSpacing(8)
         server_layout.addWidget(QLabel("<b>Common Operations</b> (Double-click to run)"))
         self.quick_query_tree = QTreeView()
         self.quick_query_tree.setHeaderHidden(True)
-        quick_query_model = QStandardItemModel(); self.quick_query_tree.setModel(quick_query_model)
+        quick_query_model = QStandardItemModel()
         self.populate_quick_query_tree(quick_query_model)
+        self.quick_query_tree.setModel(quick_query_model)
         self.quick_query_tree.expandAll()
+        # double-click on a category runs it rather than folding it
+        self.quick_query_tree.setExpandsOnDoubleClick(False)
         self.quick_query_tree.doubleClicked.connect(self.execute_quick_query)
         server_layout.addWidget(self.quick_query_tree)
-
-        # Results panel (as group box)
-        results_box = QGroupBox("Results")
-        results_layout = QVBoxLayout(results_box)
-        results_layout.setContentsMargins(10, 8, 10, 8)
-
-        display_toggle_layout = QHBoxLayout()
-        display_toggle_layout.addWidget(QLabel("Results:")); display_toggle_layout.addStretch()
-        self.view_mode_combo = QComboBox(); self.view_mode_combo.addItems(["JSON Text", "Tree View"])  
-        self.view_mode_combo.currentTextChanged.connect(self.toggle_display_mode)
-        display_toggle_layout.addWidget(QLabel("Display Mode:")); display_toggle_layout.addWidget(self.view_mode_combo)
-        # Add copy actions
-        self.copy_json_btn = QPushButton("Copy JSON")
-        self.copy_value_btn = QPushButton("Copy Value")
-        self.copy_json_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton))
-        self.copy_value_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogToParent))
-        self.copy_json_btn.setToolTip("Copy full JSON (Ctrl+Shift+C)")
-        self.copy_value_btn.setToolTip("Copy only value (Ctrl+Alt+C)")
-        display_toggle_layout.addWidget(self.copy_json_btn)
-        display_toggle_layout.addWidget(self.copy_value_btn)
-        self.copy_json_btn.clicked.connect(self.copy_full_json)
-        self.copy_value_btn.clicked.connect(self.copy_value_only)
-        QShortcut(QKeySequence("Ctrl+Shift+C"), self, activated=self.copy_full_json)
-        QShortcut(QKeySequence("Ctrl+Alt+C"), self, activated=self.copy_value_only)
-        results_layout.addLayout(display_toggle_layout)
-
-        self.results_text = QTextEdit(); self.results_text.setFont(QFont("Consolas", 10)); self.results_text.setReadOnly(True)
-        results_layout.addWidget(self.results_text)
-        self.results_tree = QTreeView(); self.results_tree.hide(); results_layout.addWidget(self.results_tree)
-        self.results_tree.setAlternatingRowColors(True)
-        self.results_tree.setUniformRowHeights(True)
-        try:
-            header = self.results_tree.header()
-            header.setStretchLastSection(True)
-            header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        except Exception:
-            pass
-
-        main_splitter.addWidget(self.tabs)
-        main_splitter.addWidget(results_box)
-        main_splitter.setSizes([560, 720])
-        main_layout.addWidget(main_splitter)
-
-        self.status_bar = QStatusBar(); self.setStatusBar(self.status_bar)
-        self.setup_copy_functionality()
-        # Theme apply
-        self.theme_combo.currentTextChanged.connect(self.apply_theme)
-
-        # Add shortcut hints/tooltips
-        self.scan_button.setToolTip("Scan (F5)")
-        self.scan_next_button.setToolTip("Next page (F6)")
-        self.btn_get.setToolTip("Get (F9)")
-        self.btn_set.setToolTip("Set/Update (Ctrl+S)")
-        self.btn_delete.setToolTip("Delete (Del)")
-        self.btn_ttl.setToolTip("TTL (Ctrl+T)")
-        self.btn_expire.setToolTip("Expire (Ctrl+E)")
-        self.btn_format.setToolTip("Format JSON (Ctrl+Shift+F)")
-        self.execute_command_button.setToolTip("Execute (Ctrl+Enter)")
-        # Keyboard shortcuts
-        QShortcut(QKeySequence("F5"), self, activated=self.execute_scan)
-        QShortcut(QKeySequence("F6"), self, activated=self.execute_scan_next)
-        QShortcut(QKeySequence("F9"), self, activated=self.execute_get_value)
-        QShortcut(QKeySequence("Ctrl+S"), self, activated=self.execute_set_value)
-        QShortcut(QKeySequence("Del"), self, activated=self.execute_delete_key)
-        QShortcut(QKeySequence("Ctrl+T"), self, activated=self.execute_ttl)
-        QShortcut(QKeySequence("Ctrl+E"), self, activated=self.execute_expire)
-        QShortcut(QKeySequence("Ctrl+Shift+F"), self, activated=self.format_json_value)
+        self.refresh_stats_button = QPushButton("Refresh Server Stats")
+        self.refresh_stats_button.setToolTip("INFO + DBSIZE + CLIENT LIST in one round trip")
+        self.refresh_stats_button.clicked.connect(self.refresh_server_stats)
+        server_layout.addWidget(self.refresh_stats_button, 0, Qt.AlignmentFlag.AlignRight)
 
     # --- Copy functionality ---
     def setup_copy_functionality(self):
@@ -671,9 +1559,14 @@ class RedisViewer(QMainWindow):
         value_index = model.index(selected_index.row(), 1, selected_index.parent())
         value_text = model.data(value_index, Qt.ItemDataRole.DisplayRole)
         text_to_copy = f"{key_text}: {value_text}" if value_text else key_text
-        if text_to_copy:
-            QApplication.clipboard().setText(text_to_copy)
-            self.status_bar.showMessage(f"Copied: '{text_to_copy}'", 3000)
+        if not text_to_copy:
+            return
+        clipboard = QApplication.clipboard()
+        # repeated Ctrl+C on the same row: skip re-announcing identical data to the clipboard manager.
+        # Only trusted while we still own the clipboard, in which case text() is answered locally
+        if not (clipboard.ownsClipboard() and clipboard.text() == text_to_copy):
+            clipboard.setText(text_to_copy)
+        self.status_bar.showMessage(f"Copied: '{text_to_copy}'", 3000)
 
     # --- Connection methods ---
     def load_selected_connection(self, index):
@@ -693,7 +1586,7 @@ class RedisViewer(QMainWindow):
         self.toggle_ssl_verify_option(self.https_checkbox.isChecked())
         self.auth_checkbox.setChecked(data.get("auth_enabled", False))
         self.user_input.setText(data.get("username", ""))
-        self.pass_input.setText(data.get("password", ""))
+        self.pass_input.setText(self._load_password(data))
         self.toggle_auth_fields(self.auth_checkbox.isChecked())
 
     def save_connection(self):
@@ -710,8 +1603,8 @@ class RedisViewer(QMainWindow):
             "verify_ssl": self.verify_ssl_checkbox.isChecked(),
             "auth_enabled": self.auth_checkbox.isChecked(),
             "username": self.user_input.text(),
-            "password": self.pass_input.text(),
         }
+        new_connection.update(self._store_password(conn_name, self.pass_input.text()))
         existing_indices = [i for i, conn in enumerate(self.connections) if conn['name'] == conn_name]
         if existing_indices:
             self.connections[existing_indices[0]] = new_connection
@@ -723,6 +1616,39 @@ class RedisViewer(QMainWindow):
             self.status_bar.showMessage(f"Connection '{conn_name}' saved.", 3000)
         self.save_settings()
 
+    @staticmethod
+    def _load_password(data: Dict[str, Any]) -> str:
+        if data.get("password_ref") and keyring is not None:
+            try:
+                return keyring.get_password(SETTINGS_APP, data["name"]) or ""
+            except Exception:
+                return ""
+        return data.get("password", "")
+
+    @staticmethod
+    def _store_password(conn_name: str, password: str) -> Dict[str, Any]:
+        """Put the password in the OS keyring when possible; returns the fields to keep in the profile."""
+        if keyring is not None:
+            try:
+                if password:
+                    keyring.set_password(SETTINGS_APP, conn_name, password)
+                    return {"password": "", "password_ref": True}
+                RedisViewer._forget_password(conn_name)
+                return {"password": ""}
+            except Exception:
+                pass  # no usable backend (e.g. headless session)
+        return {"password": password}
+
+    @staticmethod
+    def _forget_password(conn_name: str):
+        if keyring is None:
+            return
+        try:
+            if keyring.get_password(SETTINGS_APP, conn_name) is not None:
+                keyring.delete_password(SETTINGS_APP, conn_name)
+        except Exception:
+            pass
+
     def delete_connection(self):
         conn_name = self.connection_combo.currentText()
         if not conn_name:
@@ -734,7 +1660,8 @@ class RedisViewer(QMainWindow):
         if confirm == QMessageBox.StandardButton.No:
             return
         self.connections = [conn for conn in self.connections if conn['name'] != conn_name]
-        self.connection_combo.clear(); self.connection_combo.addItems([conn['name'] for conn in self.connections])
+        self._forget_password(conn_name)
+        self._set_connection_names()
         if self.connections:
             self.connection_combo.setCurrentIndex(0); self.load_selected_connection(0)
         else:
@@ -742,12 +1669,28 @@ class RedisViewer(QMainWindow):
         self.status_bar.showMessage(f"Connection '{conn_name}' deleted.", 3000)
         self.save_settings()
 
+    def _set_connection_names(self):
+        # one model swap instead of clear() + addItems(), without the index-change signals in between
+        with QSignalBlocker(self.connection_combo):
+            self._conn_model.setStringList([c['name'] for c in self.connections])
+
     def clear_connection_fields(self):
         self.host_input.clear(); self.port_input.clear(); self.db_input.clear()
         self.https_checkbox.setChecked(False); self.auth_checkbox.setChecked(False)
         self.user_input.clear(); self.pass_input.clear(); self.connection_combo.setCurrentText("")
 
     def _get_client(self) -> Optional[SimpleRedisClient]:
+        # Reuse the open client (and its pooled sockets) until a connection field changes
+        if self.redis_client is not None:
+            if time.monotonic() - self._last_ping_ts <= _PING_STALE_AFTER:
+                return self.redis_client
+            try:
+                if self.redis_client.ping():
+                    self._last_ping_ts = time.monotonic()
+                    return self.redis_client
+            except SimpleRedisClientError:
+                pass  # stale connection; rebuild below
+            self._drop_client()
         host = self.host_input.text().strip(); port = self.port_input.text().strip(); db_txt = self.db_input.text().strip() or "0"
         if not host or not port:
             QMessageBox.warning(self, 'Input Error', 'Host and Port cannot be empty.')
@@ -768,11 +1711,24 @@ class RedisViewer(QMainWindow):
             if not client.ping():
                 QMessageBox.critical(self, 'Connection Error', 'Unable to ping Redis server.')
                 return None
+            self.redis_client = client
+            self._last_ping_ts = time.monotonic()
             return client
         except SimpleRedisClientError as e:
             QMessageBox.critical(self, 'Connection Error', str(e))
             return None
 
+    def _drop_client(self, *_):
+        if self.redis_client is not None:
+            self.redis_client.close()
+        self.redis_client = None
+
+    def _client_error(self, message: str, connection_lost: bool = True):
+        # A broken connection is rebuilt on the next action; command errors keep the client
+        if connection_lost:
+            self._drop_client()
+        QMessageBox.critical(self, 'Client Error', message)
+
     def save_settings(self):
         current_conn_name = self.connection_combo.currentText()
         settings = {
@@ -781,30 +1737,63 @@ class RedisViewer(QMainWindow):
             "pattern": self.pattern_input.text(),
             "theme": self.theme_combo.currentText() if hasattr(self, 'theme_combo') else "System",
         }
+        snapshot = _json_pretty(settings)
+        # unchanged settings are not rewritten
+        if snapshot == self._last_saved_snapshot:
+            return
+        store = QSettings(SETTINGS_ORG, SETTINGS_APP)
+        self._write_settings(store, settings)
+        store.sync()
+        if store.status() != QSettings.Status.NoError:
+            self.status_bar.showMessage(f"Error saving settings: {store.status().name}", 5000)
+            return
+        self._last_saved_snapshot = snapshot
+
+    @staticmethod
+    def _write_settings(store: QSettings, settings: Dict[str, Any]):
+        # connections stay JSON text so bools/ints survive backends that store everything as strings
+        store.setValue("connections", json.dumps(settings.get("connections", []), ensure_ascii=False))
+        store.setValue("current_connection_name", settings.get("current_connection_name") or "")
+        store.setValue("pattern", settings.get("pattern", "*"))
+        store.setValue("theme", settings.get("theme", "System"))
+
+    def _import_legacy_config(self, store: QSettings):
+        if not os.path.exists(CONFIG_FILE):
+            return
         try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=4, ensure_ascii=False)
-        except IOError as e:
-            self.status_bar.showMessage(f"Error saving settings: {e}", 5000)
+            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                settings = _json_loads(f.read())
+            self._write_settings(store, settings)
+            store.sync()
+        except (IOError, json.JSONDecodeError, AttributeError) as e:
+            QMessageBox.critical(self, "Load Settings Error", f"Could not import config file {CONFIG_FILE}: {e}")
 
     def load_settings(self):
-        if not os.path.exists(CONFIG_FILE):
+        store = QSettings(SETTINGS_ORG, SETTINGS_APP)
+        if not store.contains("connections"):
+            self._import_legacy_config(store)
+        if not store.contains("connections"):
             default_conn = {
                 "name": "default", "host": "localhost", "port": "6379", "db": "0",
                 "ssl_enabled": False, "verify_ssl": True, "auth_enabled": False,
                 "username": "", "password": ""
             }
             self.connections = [default_conn]
-            self.connection_combo.addItems([c['name'] for c in self.connections])
+            self._set_connection_names()
             self.populate_connection_fields(default_conn)
             self.pattern_input.setText("*")
             self.save_settings(); return
         try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
+            settings = {
+                "connections": _json_loads(store.value("connections", "[]")),
+                "current_connection_name": store.value("current_connection_name", ""),
+                "pattern": store.value("pattern", "*"),
+                "theme": store.value("theme", "System"),
+            }
+            self._last_saved_snapshot = _json_pretty(settings)
             self.connections = settings.get("connections", [])
             current_conn_name = settings.get("current_connection_name")
-            self.connection_combo.clear(); self.connection_combo.addItems([c['name'] for c in self.connections])
+            self._set_connection_names()
             if current_conn_name and any(c['name'] == current_conn_name for c in self.connections):
                 self.connection_combo.setCurrentText(current_conn_name)
                 self.load_selected_connection(self.connection_combo.currentIndex())
@@ -818,12 +1807,88 @@ class RedisViewer(QMainWindow):
             if theme in ["System", "Light", "Dark"]:
                 self.theme_combo.setCurrentText(theme)
                 self.apply_theme(theme)
-        except (IOError, json.JSONDecodeError, KeyError) as e:
-            QMessageBox.critical(self, "Load Settings Error", f"Could not load or parse config file: {e}")
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            QMessageBox.critical(self, "Load Settings Error", f"Could not load or parse settings: {e}")
             self.clear_connection_fields()
 
+    # --- Background tasks ---
+    def _run_task(self, fn, on_done, on_settled=None) -> RedisTask:
+        """Run fn() on the thread pool; on_done(result) runs on the GUI thread, errors show a message box.
+
+        on_settled(), if given, runs after success, failure or cancellation alike.
+        """
+        return self._start_task(RedisTask(fn), on_done, on_settled)
+
+    def _start_task(self, task: RedisTask, on_done, on_settled=None) -> RedisTask:
+        self._tasks.add(task)
+
+        def _finish(result):
+            self._tasks.discard(task)
+            # a completed round trip is as good as a ping
+            self._last_ping_ts = time.monotonic()
+            if on_settled:
+                on_settled()
+            if not task.cancelled:
+                on_done(result)
+
+        def _fail(message, connection_lost):
+            self._tasks.discard(task)
+            if on_settled:
+                on_settled()
+            if not task.cancelled:
+                self.status_bar.clearMessage()
+                self._client_error(message, connection_lost)
+
+        task.signals.done.connect(_finish)
+        task.signals.failed.connect(_fail)
+        QThreadPool.globalInstance().start(task)
+        return task
+
+    def _run_latest(self, name: str, fn, on_done, button: Optional[QPushButton] = None) -> RedisTask:
+        """_run_task() where a newer call under the same name supersedes a pending one.
+
+        The superseded result is dropped when it lands; button, if given, is disabled meanwhile.
+        """
+        return self._start_latest(name, RedisTask(fn), on_done, button)
+
+    def _start_latest(self, name: str, task: RedisTask, on_done, button: Optional[QPushButton] = None) -> RedisTask:
+        previous = self._latest_tasks.get(name)
+        if previous is not None:
+            previous.cancel()
+
+        def _settled():
+            if self._latest_tasks.get(name) is task:
+                del self._latest_tasks[name]
+                if button is not None:
+                    button.setEnabled(True)
+
+        self._start_task(task, on_done, _settled)
+        self._latest_tasks[name] = task
+        if button is not None:
+            button.setEnabled(False)
+        return task
+
+    def _set_scan_running(self, running: bool):
+        self.scan_button.setEnabled(not running)
+        self.scan_next_button.setEnabled(not running and self._scan_cursor != 0)
+        self.scan_cancel_button.setEnabled(running)
+
+    def _scan_settled(self, task: RedisTask):
+        # a cancelled scan settling later must not clear the state of the scan that replaced it
+        if self._scan_task is task:
+            self._scan_task = None
+            self._set_scan_running(False)
+
+    def cancel_scan(self):
+        if self._scan_task is not None:
+            self._scan_task.cancel()
+            self._scan_settled(self._scan_task)
+            self.status_bar.showMessage('Scan cancelled.', 3000)
+
     # --- Actions ---
     def execute_scan(self):
+        if self._scan_task is not None:
+            return
         client = self._get_client()
         if not client:
             return
@@ -834,58 +1899,73 @@ class RedisViewer(QMainWindow):
         except ValueError:
             QMessageBox.warning(self, 'Input Error', 'Count must be an integer.')
             return
-        try:
-            self.status_bar.showMessage(f'Scanning keys pattern "{pattern}"...')
-            QApplication.processEvents()
-            # reset cursor
-            self._scan_cursor = 0
-            keys, next_cursor = client.scan_with_cursor(pattern=pattern, type_filter=type_filter if type_filter.lower() != 'all' else None, count=count, cursor=self._scan_cursor)
-            self._scan_cursor = next_cursor
-            self._last_scan_params = {"pattern": pattern, "type": type_filter, "count": count}
-            data = {"pattern": pattern, "type": type_filter, "count": len(keys), "keys": keys, "next_cursor": next_cursor}
-            self.populate_tree(data)
-            # populate list widget
-            self._keys_all = list(keys)
-            self.keys_list.clear()
-            self.keys_list.addItems(keys)
-            # update pagination controls
-            self.scan_next_button.setEnabled(next_cursor != 0)
-            self.scan_status_label.setText(f'Cursor: {next_cursor}')
-            self.status_bar.showMessage('Scan successful. Settings saved.', 5000)
-            self.save_settings()
-        except SimpleRedisClientError as e:
-            QMessageBox.critical(self, 'Client Error', str(e))
+        self.status_bar.showMessage(f'Scanning keys pattern "{pattern}"...')
+        # reset cursor
+        self._scan_cursor = 0
+        self._last_scan_params = {"pattern": pattern, "type": type_filter, "count": count}
+        self._keys_model.reset([])
+        task = ScanStreamTask(client, pattern, type_filter if type_filter.lower() != 'all' else None, count)
+        task.signals.page.connect(lambda page: self._on_scan_page(task, *page))
+        self._scan_task = self._start_task(task, lambda res: self._on_scan_done(*res), lambda: self._scan_settled(task))
+        self._set_scan_running(True)
+
+    def _on_scan_page(self, task: RedisTask, keys: List[str], next_cursor: int):
+        # pages still queued when the scan was cancelled are dropped
+        if task.cancelled:
+            return
+        self._scan_cursor = next_cursor
+        self._append_scanned(keys)
+        self.scan_status_label.setText(f'Cursor: {next_cursor} · {self._keys_model.total()} keys')
+
+    def _append_scanned(self, keys: List[str]):
+        self._keys_model.append_page(keys)
+        overflow = self._keys_model.total() - MAX_KEYS_IN_MEMORY
+        if overflow > 0:
+            self._keys_model.drop_first(overflow)
+            self.status_bar.showMessage('Older results trimmed — refine pattern to see all.', 5000)
+
+    def _on_scan_done(self, total: int, next_cursor: int):
+        params = self._last_scan_params
+        data = {"pattern": params["pattern"], "type": params["type"], "count": total, "next_cursor": next_cursor}
+        self.populate_tree(data)
+        self.status_bar.showMessage('Scan successful.', 5000)
 
     def execute_scan_next(self):
-        client = self._get_client()
-        if not client:
+        # checked before _get_client(), which may PING on the GUI thread
+        if self._scan_task is not None:
             return
         if self._scan_cursor == 0:
             self.status_bar.showMessage('No more results.', 3000)
             self.scan_next_button.setEnabled(False)
             return
+        client = self._get_client()
+        if not client:
+            return
         pattern = self._last_scan_params.get("pattern", "*")
         type_filter = self._last_scan_params.get("type", "All")
         count = int(self._last_scan_params.get("count", 100))
-        try:
-            self.status_bar.showMessage(f'Fetching next keys page...')
-            QApplication.processEvents()
-            keys, next_cursor = client.scan_with_cursor(pattern=pattern, type_filter=type_filter if str(type_filter).lower() != 'all' else None, count=count, cursor=self._scan_cursor)
-            self._scan_cursor = next_cursor
-            # append to list widget and cache
-            self._keys_all.extend(keys)
-            self.keys_list.addItems(keys)
-            # show in results pane as page
-            data = {"pattern": pattern, "type": type_filter, "page_size": len(keys), "next_cursor": next_cursor, "keys_page": keys}
-            self.populate_tree(data)
-            self.scan_next_button.setEnabled(next_cursor != 0)
-            self.scan_status_label.setText(f'Cursor: {next_cursor}')
-            if next_cursor == 0:
-                self.status_bar.showMessage('Reached end of scan.', 4000)
-        except SimpleRedisClientError as e:
-            QMessageBox.critical(self, 'Client Error', str(e))
+        self.status_bar.showMessage(f'Fetching next keys page...')
+        cursor = self._scan_cursor
+        task = RedisTask(
+            lambda: client.scan_with_cursor(pattern=pattern, type_filter=type_filter if str(type_filter).lower() != 'all' else None, count=count, cursor=cursor))
+        self._scan_task = self._start_task(
+            task, lambda res: self._on_scan_next_done(pattern, type_filter, *res), lambda: self._scan_settled(task))
+        self._set_scan_running(True)
+
+    def _on_scan_next_done(self, pattern: str, type_filter: str, keys: List[str], next_cursor: int):
+        self._scan_cursor = next_cursor
+        # append to keys list
+        self._append_scanned(keys)
+        # show in results pane as page
+        data = {"pattern": pattern, "type": type_filter, "page_size": len(keys), "next_cursor": next_cursor, "keys_page": keys}
+        self.populate_tree(data)
+        self.scan_next_button.setEnabled(next_cursor != 0)
+        self.scan_status_label.setText(f'Cursor: {next_cursor} · {self._keys_model.total()} keys')
+        if next_cursor == 0:
+            self.status_bar.showMessage('Reached end of scan.', 4000)
 
     def execute_get_value(self):
+        self._ensure_editor()
         client = self._get_client()
         if not client:
             return
@@ -893,28 +1973,72 @@ class RedisViewer(QMainWindow):
         if not key:
             QMessageBox.warning(self, 'Input Error', 'Key is required.')
             return
-        try:
-            self.status_bar.showMessage(f"Getting key '{key}'...")
-            data = client.get_value(key)
-            self.populate_tree(data)
-            # Update type combo based on actual type
-            if isinstance(data, dict) and data.get("type"):
-                idx = self.value_type_combo.findText(data["type"]) 
-                if idx >= 0:
-                    self.value_type_combo.setCurrentIndex(idx)
-            # Put pretty value for string/hash/etc.
-            val = data.get("value") if isinstance(data, dict) else None
-            if isinstance(val, (dict, list)):
-                self.value_text.setPlainText(json.dumps(val, indent=2, ensure_ascii=False))
-            elif val is None:
-                self.value_text.clear()
-            else:
-                self.value_text.setPlainText(str(val))
+        fmt = self.value_format_combo.currentText()
+        if fmt == "MsgPack" and not self._check_msgpack():
+            return
+        self.status_bar.showMessage(f"Getting key '{key}'...")
+        if fmt == "MsgPack":
+            fn = lambda: client.get_msgpack(key)
+        else:
+            fn = lambda: client.get_value(key, parse_json=fmt == "JSON", stream=True)
+        # large values would block the event loop while they download and parse
+        self._run_latest("value", fn, self._on_value_loaded, self.btn_get)
+
+    def _check_msgpack(self) -> bool:
+        if msgpack is None:
+            QMessageBox.warning(self, 'MsgPack', "MsgPack format needs the 'msgpack' package (pip install msgpack).")
+            return False
+        return True
+
+    def _on_value_loaded(self, data):
+        if isinstance(data, dict) and data.get("streamed"):
+            self._stream_value(data)
+            return
+        self.populate_tree(data)
+        truncated = isinstance(data, dict) and data.get("truncated")
+        # Update type combo based on actual type
+        if isinstance(data, dict) and data.get("type"):
+            idx = self.value_type_combo.findText(data["type"]) 
+            if idx >= 0:
+                self.value_type_combo.setCurrentIndex(idx)
+        # Put pretty value for string/hash/etc.
+        val = data.get("value") if isinstance(data, dict) else None
+        if isinstance(val, (dict, list)):
+            self.value_text.setPlainText(_json_pretty(val))
+        elif val is None:
+            self.value_text.clear()
+        else:
+            self.value_text.setPlainText(str(val))
+        if truncated:
+            self.status_bar.showMessage(f'Get successful (showing first {len(val)} items).', 5000)
+        else:
             self.status_bar.showMessage('Get successful.', 5000)
-        except SimpleRedisClientError as e:
-            QMessageBox.critical(self, 'Client Error', str(e))
+
+    def _stream_value(self, data: Dict[str, Any]):
+        # Too large for one setPlainText: append GETRANGE chunks as they arrive, without JSON parsing.
+        # The head already fetched goes to the stream instead of the results view
+        head = data.pop("head", b"")
+        self.populate_tree(data)
+        self.value_type_combo.setCurrentText("string")
+        self.value_text.clear()
+        key = data["key"]
+        self.status_bar.showMessage(f"Loading '{key}' ({data['length']} bytes)...")
+        client = self._get_client()
+        if not client:
+            return
+        task = StringStreamTask(client, key, head)
+        task.signals.page.connect(lambda chunk: self._on_value_chunk(task, chunk))
+        self._start_latest("value", task, lambda _n: self.status_bar.showMessage(
+            f"Get successful ({data['length']} bytes, streamed).", 5000), self.btn_get)
+
+    def _on_value_chunk(self, task: RedisTask, chunk: str):
+        if task.cancelled:
+            return
+        self.value_text.moveCursor(QTextCursor.MoveOperation.End)
+        self.value_text.insertPlainText(chunk)
 
     def execute_set_value(self):
+        self._ensure_editor()
         client = self._get_client()
         if not client:
             return
@@ -923,18 +2047,31 @@ class RedisViewer(QMainWindow):
             QMessageBox.warning(self, 'Input Error', 'Key is required.')
             return
         value_text = self.value_text.toPlainText()
-        try:
-            self.status_bar.showMessage(f"Setting key '{key}'...")
-            res = client.set_value(key, value_text, vtype)
-            self.populate_tree(res)
-            self.status_bar.showMessage('Set successful.', 5000)
-        except SimpleRedisClientError as e:
-            QMessageBox.critical(self, 'Client Error', str(e))
+        if self.value_format_combo.currentText() == "MsgPack":
+            if vtype != "string":
+                QMessageBox.warning(self, 'Input Error', 'MsgPack format applies to string values only.')
+                return
+            if not self._check_msgpack():
+                return
+            fn = lambda: client.set_msgpack(key, value_text)
+        else:
+            fn = lambda: client.set_value(key, value_text, vtype)
+        self.status_bar.showMessage(f"Setting key '{key}'...")
+        self._run_task(fn, self._on_value_set)
+
+    def _on_value_set(self, res):
+        self.populate_tree(res)
+        self.status_bar.showMessage('Set successful.', 5000)
 
     def execute_delete_key(self):
+        self._ensure_editor()
         client = self._get_client()
         if not client:
             return
+        # Del pressed in the keys list with several keys selected
+        if self.keys_list.hasFocus() and len(self._selected_keys()) > 1:
+            self.delete_selected_keys()
+            return
         key = self.key_input.text().strip()
         if not key:
             QMessageBox.warning(self, 'Input Error', 'Key is required.')
@@ -942,17 +2079,39 @@ class RedisViewer(QMainWindow):
         confirm = QMessageBox.question(self, "Confirm Delete", f"Are you sure you want to delete key '{key}'?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if confirm == QMessageBox.StandardButton.No:
             return
-        try:
-            self.status_bar.showMessage(f"Deleting key '{key}'...")
-            deleted = client.delete(key)
-            self.populate_tree({"deleted": deleted, "key": key})
-            if deleted:
-                self.value_text.clear()
-            self.status_bar.showMessage('Delete operation completed.', 5000)
-        except SimpleRedisClientError as e:
-            QMessageBox.critical(self, 'Client Error', str(e))
+        self.status_bar.showMessage(f"Deleting key '{key}'...")
+        self._run_task(lambda: client.delete(key), lambda deleted: self._on_key_deleted(key, deleted))
+
+    def _on_key_deleted(self, key: str, deleted: int):
+        self.populate_tree({"deleted": deleted, "key": key})
+        if deleted:
+            self.value_text.clear()
+            self._keys_model.remove_keys([key])
+        self.status_bar.showMessage('Delete operation completed.', 5000)
+
+    def _selected_keys(self) -> List[str]:
+        return [index.data() for index in self.keys_list.selectionModel().selectedRows()]
+
+    def delete_selected_keys(self):
+        client = self._get_client()
+        if not client:
+            return
+        keys = self._selected_keys()
+        if not keys:
+            return
+        confirm = QMessageBox.question(self, "Confirm Delete", f"Are you sure you want to delete {len(keys)} keys?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if confirm == QMessageBox.StandardButton.No:
+            return
+        self.status_bar.showMessage(f"Deleting {len(keys)} keys...")
+        self._run_task(lambda: client.delete_keys(keys), lambda deleted: self._on_keys_deleted(keys, deleted))
+
+    def _on_keys_deleted(self, keys: List[str], deleted: int):
+        self.populate_tree({"deleted": deleted, "keys": keys})
+        self._keys_model.remove_keys(keys)
+        self.status_bar.showMessage('Delete operation completed.', 5000)
 
     def execute_ttl(self):
+        self._ensure_editor()
         client = self._get_client()
         if not client:
             return
@@ -960,14 +2119,10 @@ class RedisViewer(QMainWindow):
         if not key:
             QMessageBox.warning(self, 'Input Error', 'Key is required.')
             return
-        try:
-            t = client.ttl(key)
-            self.populate_tree({"key": key, "ttl": t})
-            self.status_bar.showMessage('TTL fetched.', 5000)
-        except SimpleRedisClientError as e:
-            QMessageBox.critical(self, 'Client Error', str(e))
+        self._run_task(lambda: client.ttl(key), lambda t: self._show_result({"key": key, "ttl": t}, 'TTL fetched.'))
 
     def execute_expire(self):
+        self._ensure_editor()
         client = self._get_client()
         if not client:
             return
@@ -980,14 +2135,11 @@ class RedisViewer(QMainWindow):
         except ValueError:
             QMessageBox.warning(self, 'Input Error', 'Expire seconds must be an integer.')
             return
-        try:
-            ok = client.expire(key, seconds)
-            self.populate_tree({"key": key, "expire": seconds, "acknowledged": ok})
-            self.status_bar.showMessage('Expire set.', 5000)
-        except SimpleRedisClientError as e:
-            QMessageBox.critical(self, 'Client Error', str(e))
+        self._run_task(lambda: client.expire(key, seconds),
+                       lambda ok: self._show_result({"key": key, "expire": seconds, "acknowledged": ok}, 'Expire set.'))
 
     def execute_custom_command(self):
+        self._ensure_console()
         client = self._get_client()
         if not client:
             return
@@ -995,43 +2147,37 @@ class RedisViewer(QMainWindow):
         if not cmdline:
             QMessageBox.warning(self, 'Input Error', 'Command cannot be empty.')
             return
-        import shlex
         try:
-            parts = shlex.split(cmdline)
-            self.status_bar.showMessage(f"Executing: {' '.join(parts)}")
-            res = client.custom(parts)
-            # Normalize to displayable structure
-            data = {"command": parts[0], "args": parts[1:], "result": res}
-            self.populate_tree(data)
-            self.status_bar.showMessage('Command executed.', 5000)
-        except SimpleRedisClientError as e:
-            QMessageBox.critical(self, 'Client Error', str(e))
+            # only quotes and backslashes need shlex; anything else splits on whitespace alone
+            parts = shlex.split(cmdline) if _SHELL_QUOTING.search(cmdline) else cmdline.split()
         except ValueError as e:
             QMessageBox.critical(self, 'Parse Error', str(e))
+            return
+        self.status_bar.showMessage(f"Executing: {' '.join(parts)}")
+        # Normalize to displayable structure
+        self._run_task(lambda: client.custom(parts),
+                       lambda res: self._show_result({"command": parts[0], "args": parts[1:], "result": res}, 'Command executed.'))
+
+    def _show_result(self, data: Any, message: str):
+        self.populate_tree(data)
+        self.status_bar.showMessage(message, 5000)
 
     def populate_quick_query_tree(self, model: QStandardItemModel):
-        root_item = model.invisibleRootItem()
-        server_cat = QStandardItem("🌐 Server")
-        server_cat.setEditable(False); server_cat.setSelectable(False)
-        root_item.appendRow(server_cat)
-        for name, op in {
-            "INFO": {"op": "info"},
-            "DBSIZE": {"op": "dbsize"},
-        }.items():
-            it = QStandardItem(name); it.setEditable(False); it.setData(op, Qt.ItemDataRole.UserRole)
-            server_cat.appendRow(it)
-
-        client_cat = QStandardItem("👥 Client")
-        client_cat.setEditable(False); client_cat.setSelectable(False)
-        root_item.appendRow(client_cat)
-        # We'll implement some via custom commands for simplicity
-        for name, cmd in {
-            "CLIENT LIST": "CLIENT LIST",
-            "SLOWLOG GET 10": "SLOWLOG GET 10",
-            "CONFIG GET *": "CONFIG GET *",
-        }.items():
-            it = QStandardItem(name); it.setEditable(False); it.setData({"cmd": cmd}, Qt.ItemDataRole.UserRole)
-            client_cat.appendRow(it)
+        # read-only rows; categories cannot be selected
+        cat_flags = Qt.ItemFlag.ItemIsEnabled
+        item_flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        role = Qt.ItemDataRole.UserRole
+        cats = []
+        for category, entries in _QUICK_QUERY_TREE:
+            cat = QStandardItem(category)
+            cat.setFlags(cat_flags)
+            items = []
+            for name, data in entries:
+                it = QStandardItem(name); it.setFlags(item_flags); it.setData(data, role)
+                items.append(it)
+            cat.appendRows(items)
+            cats.append(cat)
+        model.invisibleRootItem().appendRows(cats)
 
     def execute_quick_query(self, index):
         item = self.quick_query_tree.model().itemFromIndex(index)
@@ -1039,98 +2185,201 @@ class RedisViewer(QMainWindow):
             return
         data = item.data(Qt.ItemDataRole.UserRole)
         if not data:
+            if item.hasChildren():
+                self._run_quick_category(item)
             return
         if "op" in data:
             # direct method
             client = self._get_client()
             if not client:
                 return
-            try:
-                if data["op"] == "info":
-                    res = client.info()
-                elif data["op"] == "dbsize":
-                    res = {"dbsize": client.dbsize()}
-                else:
-                    res = {"message": "Unknown op"}
-                self.populate_tree(res)
-                self.status_bar.showMessage('Operation executed.', 5000)
-            except SimpleRedisClientError as e:
-                QMessageBox.critical(self, 'Client Error', str(e))
+            if data["op"] == "info":
+                fn = client.info
+            elif data["op"] == "dbsize":
+                fn = lambda: {"dbsize": client.dbsize()}
+            else:
+                fn = lambda: {"message": "Unknown op"}
+            self.status_bar.showMessage('Running operation...')
+            self._run_latest("quick_query", fn, lambda res: self._show_result(res, 'Operation executed.'))
         elif "cmd" in data:
+            self._ensure_console()
             self.command_input.setText(data["cmd"])  # preload to console
             self.tabs.setCurrentWidget(self.tab_console)
 
+    def _run_quick_category(self, category: QStandardItem):
+        client = self._get_client()
+        if not client:
+            return
+        names, commands = [], []
+        for row in range(category.rowCount()):
+            child = category.child(row)
+            data = child.data(Qt.ItemDataRole.UserRole) or {}
+            parts = _QUICK_OP_COMMANDS.get(data.get("op")) or data.get("cmd", "").split()
+            if parts:
+                names.append(child.text()); commands.append(parts)
+        self.status_bar.showMessage(f"Running {len(commands)} operations...")
+        self._run_latest("quick_query", lambda: dict(zip(names, client.pipeline(commands))),
+                         lambda res: self._show_result(res, 'Operations executed.'))
+
+    def refresh_server_stats(self):
+        client = self._get_client()
+        if not client:
+            return
+        names = [name for name, _ in _SERVER_STATS_COMMANDS]
+        commands = [parts for _, parts in _SERVER_STATS_COMMANDS]
+        self.status_bar.showMessage('Refreshing server stats...')
+        self._run_latest("server_stats", lambda: dict(zip(names, client.pipeline(commands))),
+                         lambda res: self._show_result(res, 'Server stats refreshed.'), self.refresh_stats_button)
+
     # --- Result display helpers ---
     def populate_tree(self, data: Any):
-        model = QStandardItemModel(); model.setHorizontalHeaderLabels(['Key', 'Value'])
-        self.results_tree.setModel(model); root_item = model.invisibleRootItem()
-        self._populate_tree_model(data, root_item)
-        self.results_text.setPlainText(json.dumps(data, indent=2, ensure_ascii=False))
-        # Enable default sorting by key
-        try:
-            self.results_tree.setSortingEnabled(True)
-            self.results_tree.sortByColumn(0, Qt.SortOrder.AscendingOrder)
-        except Exception:
-            pass
-        self.results_tree.expandToDepth(2)
-
-    def _populate_tree_model(self, data: Any, parent_item: QStandardItem):
-        if isinstance(data, dict):
-            for key, value in data.items():
-                key_item = QStandardItem(str(key)); key_item.setEditable(False)
-                value_item = QStandardItem(); value_item.setEditable(False)
-                parent_item.appendRow([key_item, value_item])
-                if isinstance(value, (dict, list)):
-                    self._populate_tree_model(value, key_item)
-                else:
-                    value_item.setText(str(value))
-        elif isinstance(data, list):
-            for index, value in enumerate(data):
-                index_item = QStandardItem(f"[{index}]"); index_item.setEditable(False)
-                value_item = QStandardItem(); value_item.setEditable(False)
-                parent_item.appendRow([index_item, value_item])
-                if isinstance(value, (dict, list)):
-                    self._populate_tree_model(value, index_item)
-                else:
-                    value_item.setText(str(value))
+        # JSON text is only rendered when the JSON pane is showing (or a copy needs it),
+        # and the tree model is only built when the tree is
+        self._pending_data = data
+        self._json_cache = None
+        self._json_shown = False
+        self._tree_shown = False
+        if self.results_text.isHidden():
+            self.results_text.clear()
         else:
-            key_item = QStandardItem("value"); key_item.setEditable(False)
-            value_item = QStandardItem(str(data)); value_item.setEditable(False)
-            parent_item.appendRow([key_item, value_item])
+            self._show_results_json()
+        if not self.results_tree.isHidden():
+            self._show_results_tree()
+
+    def _show_results_tree(self):
+        if self._tree_shown:
+            return
+        self._tree_shown = True
+        # The model reads data in place; rows only become nodes once the view asks for them
+        model = RedisResultModel(self._pending_data)
+        tree = self.results_tree
+        tree.setUpdatesEnabled(False)
+        try:
+            if self._results_proxy is not None:
+                self._results_proxy.setSourceModel(model)
+            else:
+                tree.setModel(model)
+            self._expand_results(tree.model(), QModelIndex(), 0)
+        finally:
+            tree.setUpdatesEnabled(True)
+
+    def _enable_results_sorting(self, section: int):
+        # First header click: put a sort proxy in front of the results; later clicks are handled by the view
+        if self._results_proxy is not None:
+            return
+        tree = self.results_tree
+        proxy = QSortFilterProxyModel(self)
+        proxy.setSourceModel(tree.model())
+        self._results_proxy = proxy
+        tree.setUpdatesEnabled(False)
+        try:
+            tree.setModel(proxy)
+            tree.header().setSortIndicator(section, Qt.SortOrder.AscendingOrder)
+            tree.setSortingEnabled(True)
+            self._expand_results(proxy, QModelIndex(), 0)
+        finally:
+            tree.setUpdatesEnabled(True)
+
+    def _expand_results(self, model: QAbstractItemModel, parent: QModelIndex, depth: int):
+        # Same reach as expandToDepth(2), but the children of a large container stay collapsed:
+        # expandToDepth visits (and materializes) every row of e.g. a 100k-field hash
+        expand = self.results_tree.expand
+        stack = [(parent, depth)]
+        while stack:
+            parent, depth = stack.pop()
+            if model.canFetchMore(parent):
+                model.fetchMore(parent)
+            rows = model.rowCount(parent)
+            # more rows than one fetch batch shows: the container is large, leave its children collapsed
+            if rows > _EXPAND_CHILD_LIMIT or model.canFetchMore(parent):
+                continue
+            for row in range(rows):
+                index = model.index(row, 0, parent)
+                if model.hasChildren(index):
+                    expand(index)
+                    if depth < 2:
+                        stack.append((index, depth + 1))
+
+    def _results_json(self) -> str:
+        if self._json_cache is None:
+            self._json_cache = _json_pretty(self._pending_data)
+        return self._json_cache
+
+    def _show_results_json(self):
+        if self._json_shown:
+            return
+        self._json_shown = True
+        if self._json_cache is not None:
+            self.results_text.setPlainText(self._json_cache)
+            return
+        data = self._pending_data
+        if _fits_format_budget(data):
+            # small results (TTL, a few fields, ...) format instantly; no placeholder flash
+            self._json_cache = _json_pretty(data)
+            self.results_text.setPlainText(self._json_cache)
+            return
+        # Pretty-print on the thread pool; the pane shows a placeholder until the text is ready
+        self.results_text.setPlainText("Formatting…")
+        task = RedisTask(functools.partial(_json_pretty, data))
+        self._tasks.add(task)
+
+        def _formatted(text):
+            self._tasks.discard(task)
+            # a newer result replaced this one meanwhile
+            if data is not self._pending_data:
+                return
+            if self._json_cache is None:
+                self._json_cache = text
+            self.results_text.setPlainText(self._json_cache)
+
+        def _failed(message, _connection_lost):
+            self._tasks.discard(task)
+            if data is self._pending_data:
+                self.results_text.setPlainText(f"Could not format result as JSON: {message}")
+
+        task.signals.done.connect(_formatted)
+        task.signals.failed.connect(_failed)
+        QThreadPool.globalInstance().start(task)
 
     def toggle_display_mode(self, mode):
         if mode == "JSON Text":
+            self._show_results_json()
             self.results_tree.hide(); self.results_text.show()
         else:
+            self._show_results_tree()
             self.results_text.hide(); self.results_tree.show()
 
+    def _apply_keys_filter(self):
+        self.filter_keys_list(self.keys_filter_input.text())
+
     def filter_keys_list(self, text: str):
-        q = text.strip().lower()
-        for i in range(self.keys_list.count()):
-            item = self.keys_list.item(i)
-            item.setHidden(q not in item.text().lower())
+        needle = text.strip().lower()
+        # e.g. only surrounding whitespace or case changed: skip re-testing every key
+        if needle == self._keys_filter_text:
+            return
+        self._keys_filter_text = needle
+        self._keys_model.set_filter(needle)
 
     def copy_full_json(self):
-        text = self.results_text.toPlainText()
+        text = self._results_json()
         if text:
             QApplication.clipboard().setText(text)
             self.status_bar.showMessage('JSON copied.', 2000)
 
     def copy_value_only(self):
-        # Try to extract only the value portion from the last data
-        try:
-            obj = json.loads(self.results_text.toPlainText() or '{}')
-        except Exception:
-            obj = {}
+        # Extract only the value portion of the last result, read from the data itself instead of re-parsing its JSON
+        obj = self._pending_data if self._pending_data is not None else {}
         value = None
         # Prefer common keys
-        for k in ["value", "result", "keys", "data"]:
-            if isinstance(obj, dict) and k in obj:
-                value = obj[k]
-                break
+        if isinstance(obj, dict):
+            for k in _VALUE_KEYS:
+                if k in obj:
+                    value = obj[k]
+                    break
         if value is None:
-            # fallback to current selection's value column
-            sel = self.results_tree.selectionModel().selectedIndexes() if self.results_tree.model() else []
+            # fallback to current selection's value column, unless the tree still shows an older result
+            tree = self.results_tree
+            sel = tree.selectionModel().selectedIndexes() if self._tree_shown and tree.model() else []
             if sel:
                 model = self.results_tree.model()
                 idx = sel[0]
@@ -1139,7 +2388,7 @@ class RedisViewer(QMainWindow):
             else:
                 value = obj
         try:
-            text = json.dumps(value, ensure_ascii=False, indent=2)
+            text = _json_pretty(value)
         except Exception:
             text = str(value)
         if text:
@@ -1148,44 +2397,38 @@ class RedisViewer(QMainWindow):
 
     # Theming helpers
     def apply_theme(self, theme: str):
-        # Use Fusion for consistent theming
-        QApplication.instance().setStyle("Fusion")
+        if theme == self._applied_theme:
+            return
         app = QApplication.instance()
-        if theme == "Dark":
-            palette = QPalette()
-            palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
-            palette.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.white)
-            palette.setColor(QPalette.ColorRole.Base, QColor(35, 35, 35))
-            palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
-            palette.setColor(QPalette.ColorRole.ToolTipBase, Qt.GlobalColor.white)
-            palette.setColor(QPalette.ColorRole.ToolTipText, Qt.GlobalColor.white)
-            palette.setColor(QPalette.ColorRole.Text, Qt.GlobalColor.white)
-            palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-            palette.setColor(QPalette.ColorRole.ButtonText, Qt.GlobalColor.white)
-            palette.setColor(QPalette.ColorRole.BrightText, Qt.GlobalColor.red)
-            palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-            palette.setColor(QPalette.ColorRole.HighlightedText, Qt.GlobalColor.black)
-            app.setPalette(palette)
-            app.setStyleSheet("""
-                QGroupBox { font-weight: 600; border: 1px solid #3c3c3c; border-radius: 6px; margin-top: 6px; }
-                QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 4px; }
-                QLineEdit, QComboBox, QTextEdit { border: 1px solid #3c3c3c; border-radius: 4px; padding: 4px; }
-                QPushButton { padding: 4px 10px; border: 1px solid #3c3c3c; border-radius: 4px; }
-                QPushButton:hover { border-color: #2a82da; }
-            """)
-        elif theme == "Light":
-            app.setPalette(QApplication.style().standardPalette())
-            app.setStyleSheet("""
-                QGroupBox { font-weight: 600; border: 1px solid #e0e0e0; border-radius: 6px; margin-top: 6px; }
-                QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 4px; }
-                QLineEdit, QComboBox, QTextEdit { border: 1px solid #d0d0d0; border-radius: 4px; padding: 4px; }
-                QPushButton { padding: 4px 10px; border: 1px solid #d0d0d0; border-radius: 4px; }
-                QPushButton:hover { border-color: #2a82da; }
-            """)
-        else:
-            # System
-            app.setPalette(QApplication.style().standardPalette())
-            app.setStyleSheet("")
+        # Use Fusion for consistent theming; setting a style re-polishes every widget, so only once
+        if app.style().name().lower() != "fusion":
+            app.setStyle("Fusion")
+        palette = RedisViewer._PALETTE_CACHE.get(theme)
+        if palette is None:
+            palette = RedisViewer._PALETTE_CACHE[theme] = self._build_palette(theme)
+        app.setPalette(palette)
+        app.setStyleSheet(_THEME_QSS.get(theme, ""))
+        self._applied_theme = theme
+
+    @staticmethod
+    def _build_palette(theme: str) -> QPalette:
+        if theme != "Dark":
+            # Light and System
+            return QApplication.style().standardPalette()
+        palette = QPalette()
+        palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
+        palette.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.white)
+        palette.setColor(QPalette.ColorRole.Base, QColor(35, 35, 35))
+        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
+        palette.setColor(QPalette.ColorRole.ToolTipBase, Qt.GlobalColor.white)
+        palette.setColor(QPalette.ColorRole.ToolTipText, Qt.GlobalColor.white)
+        palette.setColor(QPalette.ColorRole.Text, Qt.GlobalColor.white)
+        palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
+        palette.setColor(QPalette.ColorRole.ButtonText, Qt.GlobalColor.white)
+        palette.setColor(QPalette.ColorRole.BrightText, Qt.GlobalColor.red)
+        palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
+        palette.setColor(QPalette.ColorRole.HighlightedText, Qt.GlobalColor.black)
+        return palette
 
     # --- Toggles ---
     def toggle_ssl_verify_option(self, checked):
@@ -1195,21 +2438,25 @@ class RedisViewer(QMainWindow):
         self.user_label.setVisible(checked); self.user_input.setVisible(checked)
         self.pass_label.setVisible(checked); self.pass_input.setVisible(checked)
 
-    def open_key_from_list(self, item):
-        key = item.text()
+    def open_key_from_list(self, index):
+        self._ensure_editor()
+        key = index.data()
         self.key_input.setText(key)
         self.tabs.setCurrentWidget(self.tab_editor)
         self.execute_get_value()
 
     def open_keys_list_menu(self, pos):
-        item = self.keys_list.itemAt(pos)
-        if not item:
+        self._ensure_editor()
+        index = self.keys_list.indexAt(pos)
+        if not index.isValid():
             return
-        key = item.text()
+        key = index.data()
+        selected = self._selected_keys()
+        multi = len(selected) > 1 and key in selected
         menu = QMenu(self)
         act_open = QAction("Open", self)
         act_copy = QAction("Copy Key", self)
-        act_delete = QAction("Delete", self)
+        act_delete = QAction(f"Delete {len(selected)} Keys" if multi else "Delete", self)
         act_ttl = QAction("TTL", self)
         act_expire = QAction("Expire 3600s", self)
         menu.addAction(act_open)
@@ -1228,9 +2475,11 @@ class RedisViewer(QMainWindow):
             QApplication.clipboard().setText(key)
             self.status_bar.showMessage("Key copied.", 2000)
         def _delete():
+            if multi:
+                self.delete_selected_keys()
+                return
             self.key_input.setText(key)
             self.execute_delete_key()
-            # remove item from list if deleted
         def _ttl():
             self.key_input.setText(key)
             self.execute_ttl()
@@ -1250,20 +2499,20 @@ class RedisViewer(QMainWindow):
         client = self._get_client()
         if not client:
             return
-        try:
-            info = client.info()
-            self.populate_tree({"ping": True, "server": {"redis_version": info.get("redis_version"), "mode": info.get("redis_mode"), "os": info.get("os")}})
-            self.status_bar.showMessage('Connection OK.', 4000)
-        except SimpleRedisClientError as e:
-            QMessageBox.critical(self, 'Client Error', str(e))
+        self._run_latest("test", client.info, self._on_connection_tested, self.test_connection_button)
+
+    def _on_connection_tested(self, info: Dict[str, Any]):
+        self.populate_tree({"ping": True, "server": {"redis_version": info.get("redis_version"), "mode": info.get("redis_mode"), "os": info.get("os")}})
+        self.status_bar.showMessage('Connection OK.', 4000)
 
     def format_json_value(self):
+        self._ensure_editor()
         text = self.value_text.toPlainText().strip()
         if not text:
             return
         try:
-            obj = json.loads(text)
-            self.value_text.setPlainText(json.dumps(obj, indent=2, ensure_ascii=False))
+            obj = _json_loads(text)
+            self.value_text.setPlainText(_json_pretty(obj))
             self.status_bar.showMessage('JSON formatted.', 3000)
         except Exception:
             # Not JSON; ignore
@@ -1283,8 +2532,8 @@ def main():
     app.setFont(QFont("Segoe UI", 10))
     viewer = RedisViewer()
     viewer.setWindowIcon(QIcon(resource_path("favicon.ico")))
-    # Apply default theme
-    viewer.apply_theme("System")
+    # Apply the restored theme (System unless the settings chose another)
+    viewer.apply_theme(viewer.theme_combo.currentText())
     viewer.show()
     sys.exit(app.exec())
 
@@ -30,6 +30,14 @@ setup(
         "PyQt6",
         "redis>=4.5",
     ],
+    extras_require={
+        # C reply parser (picked up automatically by redis-py) and C JSON codec
+        "speedups": ["hiredis", "orjson"],
+        # store connection passwords in the OS keyring instead of the settings
+        "keyring": ["keyring"],
+        # read/write MessagePack-encoded string values in the key editor
+        "msgpack": ["msgpack"],
+    },
     entry_points={
         "gui_scripts": [
             "redis-viewer = redis_gui:main",
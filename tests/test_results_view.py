@@ -0,0 +1,39 @@
+import json
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+import redis_gui  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def viewer(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(redis_gui, "CONFIG_FILE", tmp_path / "legacy.json")
+    redis_gui.QSettings.setPath(redis_gui.QSettings.Format.NativeFormat,
+                                redis_gui.QSettings.Scope.UserScope, str(tmp_path))
+    w = redis_gui.RedisViewer()
+    yield w
+    w.close()
+
+
+def test_copy_value_ignores_selection_of_previous_result(app, viewer):
+    viewer.view_mode_combo.setCurrentText("Tree View")
+    viewer.populate_tree({"type": "hash", "key": "h", "value": {"f": "old-value"}})
+    model = viewer.results_tree.model()
+    value_row = model.index(2, 0)
+    viewer.results_tree.setCurrentIndex(model.index(0, 1, value_row))
+
+    viewer.view_mode_combo.setCurrentText("JSON Text")
+    ttl = {"key": "h", "ttl": 42}
+    viewer.populate_tree(ttl)
+    viewer.copy_value_only()
+
+    assert json.loads(app.clipboard().text()) == ttl